@@ -0,0 +1,121 @@
+"""
+Eng2Kor.conv_ko2en, conv_en2ko 처리 속도 측정
+
+    python -m benchmark.bench_eng2kor [MB]
+
+conv_ko2en  legacy : split_ko 기반 기존 구현, table : 변환 테이블(str.translate) 구현
+conv_en2ko  legacy : split_en 기반 기존 구현, scan : scan_en 기반 단일 패스 구현
+conv_ko2en_bulk  상품명 길이 행 단위 처리량(rows/sec), 행별 conv_ko2en 호출과 비교
+"""
+import random
+import sys
+import time
+
+import pandas as pd
+
+from common.utiltiy import Eng2Kor
+
+
+def legacy_conv_ko2en(string):
+    idx_groups = Eng2Kor.split_ko(string)
+    converted_string = ''
+    for idx_group in idx_groups:
+        for idx_capsule in enumerate(idx_group):
+            if idx_capsule[1] == " " or type(idx_capsule[1]) is not int:
+                converted_string += idx_capsule[1]
+                continue
+            elif 12593 <= idx_capsule[1] <= 12643:
+                converted_string += Eng2Kor.raw_mapper[idx_capsule[1] - 12593]
+                continue
+            if idx_capsule[0] == 0:
+                converted_string += Eng2Kor.ko_top_en[idx_capsule[1]]
+            elif idx_capsule[0] == 1:
+                converted_string += Eng2Kor.ko_mid_en[idx_capsule[1]]
+            elif idx_capsule[0] == 2:
+                converted_string += Eng2Kor.ko_bot_en[idx_capsule[1]]
+    return converted_string
+
+
+def legacy_conv_en2ko(string):
+    char_groups = Eng2Kor.split_en(string)
+    converted_string = ''
+    for char_group in char_groups:
+        top_idx = 0
+        mid_idx = 0
+        bot_idx = 0
+        for char_capsule in enumerate(char_group):
+            if char_capsule[1] == " " or char_capsule[1].isdigit() or (not char_capsule[1].encode().isalpha()):
+                converted_string += char_capsule[1]
+                break
+            if len(char_group) == 1:
+                converted_string += chr(Eng2Kor.raw_mapper.index(char_capsule[1]) + 12593)
+                break
+            if char_capsule[0] == 0:
+                top_idx = Eng2Kor.ko_top_en.index(char_capsule[1])
+            elif char_capsule[0] == 1:
+                mid_idx = Eng2Kor.ko_mid_en.index(char_capsule[1])
+            elif char_capsule[0] == 2:
+                bot_idx = Eng2Kor.ko_bot_en.index(char_capsule[1])
+        else:
+            converted_string += chr((top_idx * 21 * 28 + mid_idx * 28 + bot_idx) + 44032)
+    return converted_string
+
+
+def korean_text(size: int) -> str:
+    """
+        size 바이트(UTF-8) 내외의 한글 + 자모 + 공백/숫자/영문 혼합 텍스트 생성
+    """
+    rand = random.Random(0)
+    pool = [chr(c) for c in range(44032, 55204)] + [chr(c) for c in range(12593, 12644)] + list(' 0123456789abc.,')
+    chars = []
+    length = 0
+    while length < size:
+        c = rand.choice(pool)
+        chars.append(c)
+        length += len(c.encode())
+    return ''.join(chars)
+
+
+def _measure(func, text: str) -> float:
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main(mb: float = 1) -> None:
+    text = korean_text(int(mb * 1024 * 1024))
+    assert legacy_conv_ko2en(text) == Eng2Kor.conv_ko2en(text)
+
+    Eng2Kor.ko2en_table()
+    legacy = _measure(legacy_conv_ko2en, text)
+    table = _measure(Eng2Kor.conv_ko2en, text)
+    print(f'conv_ko2en {mb} MB  legacy {legacy:.3f}s  table {table:.4f}s  x{legacy / table:.0f}')
+
+    # 검색어 길이의 잘못된 자판 입력
+    queries = [Eng2Kor.conv_ko2en(text[i:i + 8]) for i in range(0, 80000, 8)]
+    assert [legacy_conv_en2ko(q) for q in queries] == [Eng2Kor.conv_en2ko(q) for q in queries]
+
+    Eng2Kor.en2ko_tables()
+    legacy = _measure(lambda qs: [legacy_conv_en2ko(q) for q in qs], queries) / len(queries) * 1e6
+    scan = _measure(lambda qs: [Eng2Kor.conv_en2ko(q) for q in qs], queries) / len(queries) * 1e6
+    print(f'conv_en2ko {len(queries)} queries  legacy {legacy:.1f}us  scan {scan:.1f}us  x{legacy / scan:.1f}')
+
+    # 상품명 길이(1~4 어절)의 행
+    rand = random.Random(1)
+    rows = []
+    start = 0
+    while start < len(text):
+        size = rand.randint(2, 20)
+        rows.append(text[start:start + size])
+        start += size
+    series = pd.Series(rows, dtype=object)
+    assert Eng2Kor.conv_ko2en_bulk(series).tolist() == [Eng2Kor.conv_ko2en(row) for row in rows]
+
+    Eng2Kor.ko2en_arrays()
+    loop = len(rows) / _measure(lambda s: s.map(Eng2Kor.conv_ko2en), series)
+    bulk = len(rows) / _measure(Eng2Kor.conv_ko2en_bulk, series)
+    print(f'conv_ko2en_bulk {len(rows)} rows  loop {loop:,.0f} rows/s  bulk {bulk:,.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1)
@@ -0,0 +1,74 @@
+"""
+RSAUtility encode/decode 호출당 지연시간 측정
+
+    python -m benchmark.bench_rsa [반복횟수] [MB]
+
+cold : 매 호출마다 키 캐시를 비워 키 파일 로드 + PEM 파싱을 포함 (기존 동작)
+warm : 캐시된 키와 cipher 객체를 재사용
+hybrid : encode_stream/decode_stream 처리량(MB/s), 64KB 단위 입력
+"""
+import os
+import sys
+import tempfile
+import time
+
+from Crypto.PublicKey import RSA
+
+from common.auth import RSAUtility
+
+
+def _measure(func, loop: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loop):
+        func()
+    return (time.perf_counter() - start) / loop * 1e6
+
+
+def _throughput(func, size: int) -> float:
+    start = time.perf_counter()
+    func()
+    return size / 1024 / 1024 / (time.perf_counter() - start)
+
+
+def main(loop: int = 200, mb: float = 64) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        private_path = os.path.join(tmp, 'private.pem')
+        public_path = os.path.join(tmp, 'public.pem')
+        key = RSA.generate(2048)
+        with open(private_path, 'wb') as f:
+            f.write(key.export_key('PEM'))
+        with open(public_path, 'wb') as f:
+            f.write(key.public_key().export_key('PEM'))
+
+        rsa = RSAUtility(private_path, public_path)
+        token = rsa.encode('password1234!')
+
+        def cold_encode():
+            RSAUtility.invalidate_key()
+            rsa.encode('password1234!')
+
+        def cold_decode():
+            RSAUtility.invalidate_key()
+            rsa.decode(token)
+
+        results = [
+            ('encode', 'cold', _measure(cold_encode, loop)),
+            ('encode', 'warm', _measure(lambda: rsa.encode('password1234!'), loop)),
+            ('decode', 'cold', _measure(cold_decode, loop)),
+            ('decode', 'warm', _measure(lambda: rsa.decode(token), loop)),
+        ]
+
+        size = int(mb * 1024 * 1024)
+        piece = os.urandom(64 * 1024)
+        chunks = [piece] * (size // len(piece))
+        en_chunks = list(rsa.encode_stream(chunks))
+        encode = _throughput(lambda: sum(map(len, rsa.encode_stream(chunks))), size)
+        decode = _throughput(lambda: sum(map(len, rsa.decode_stream(en_chunks))), size)
+
+    for name, mode, usec in results:
+        print(f'{name:<8}{mode:<6}{usec:>10.1f} us/call')
+    print(f'hybrid {mb} MB  encode {encode:.0f} MB/s  decode {decode:.0f} MB/s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, float(sys.argv[2]) if len(sys.argv) > 2 else 64)
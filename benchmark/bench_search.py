@@ -0,0 +1,145 @@
+"""
+common/search.py 색인 메모리, 검색 속도 측정
+
+    python -m benchmark.bench_search [검색어 수]
+
+layout  LayoutSearchIndex 생성 시간, 메모리, 파일 저장/로드 시간, 검색 지연시간
+        scan : 검색어마다 conv_en2ko로 바꾼 뒤 전체 목록을 startswith로 찾는 기존 방식
+choseong ChoseongIndex 생성 시간, 메모리, 추가/삭제, 검색 지연시간
+        scan : 검색어마다 전체 목록을 split_ko로 분해하여 찾는 기존 방식
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from common.search import ChoseongIndex, LayoutSearchIndex
+from common.utiltiy import Eng2Kor
+
+
+def catalog_terms(count: int) -> list:
+    """
+        2~8 음절 한글 검색어 count개 생성, 약 5%는 영문 검색어
+    """
+    rand = random.Random(0)
+    syllables = [chr(c) for c in range(44032, 55204, 7)]
+    words = ['iPhone', 'Galaxy', 'Apple', 'Samsung', 'USB', 'Pro', 'Max']
+    terms = []
+    for _ in range(count):
+        if rand.random() < 0.05:
+            terms.append(' '.join(rand.choices(words, k=rand.randint(1, 3))) + str(rand.randint(1, 99)))
+        else:
+            terms.append(''.join(rand.choices(syllables, k=rand.randint(2, 8))))
+    return terms
+
+
+def queries(terms: list, count: int = 1000) -> list:
+    """
+        검색어 앞부분을 한글, 영문 자판 입력으로 절반씩 섞은 질의 리스트
+    """
+    rand = random.Random(1)
+    result = []
+    for term in rand.sample(terms, count):
+        prefix = term[:rand.randint(1, len(term))]
+        result.append(Eng2Kor.conv_ko2en(prefix) if rand.random() < 0.5 else prefix)
+    return result
+
+
+def scan_search(terms: list, query: str, limit: int = 10) -> list:
+    found = [term for term in terms if term.startswith(query)]
+    converted = Eng2Kor.conv_en2ko(query)
+    if converted != query:
+        found += [term for term in terms if term.startswith(converted)]
+    return found[:limit]
+
+
+def _memory(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def layout(terms: list) -> None:
+    index, elapsed, memory = _memory(lambda: LayoutSearchIndex.build(terms))
+    print(f'layout build {len(terms):,} terms  {elapsed:.2f}s  {memory / 1024 / 1024:.1f} MB')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'layout.idx')
+        start = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        index = LayoutSearchIndex.load(path)
+        loaded = time.perf_counter() - start
+        print(f'layout file {os.path.getsize(path) / 1024 / 1024:.1f} MB  save {saved:.3f}s  load {loaded:.3f}s')
+
+    qs = queries(terms)
+    start = time.perf_counter()
+    for q in qs:
+        index.search(q)
+    indexed = (time.perf_counter() - start) / len(qs) * 1e6
+
+    sample = qs[:20]
+    start = time.perf_counter()
+    for q in sample:
+        scan_search(terms, q)
+    scanned = (time.perf_counter() - start) / len(sample) * 1e6
+    print(f'layout search  scan {scanned:,.0f}us  index {indexed:,.1f}us  x{scanned / indexed:,.0f}')
+
+
+def scan_choseong(terms: list, query: str, limit: int = 10) -> list:
+    query = [Eng2Kor.ko_top.index(c) for c in query]
+    found = []
+    for term in terms:
+        tops = [split[0] for split in Eng2Kor.split_ko(term) if isinstance(split, tuple)]
+        for start in range(len(tops) - len(query) + 1):
+            if tops[start:start + len(query)] == query:
+                found.append((start, len(tops), term))
+                break
+    return [term for _, _, term in sorted(found)[:limit]]
+
+
+def choseong(terms: list) -> None:
+    index, elapsed, memory = _memory(lambda: ChoseongIndex(terms))
+    print(f'choseong build {len(terms):,} terms  {elapsed:.2f}s  {memory / 1024 / 1024:.1f} MB')
+
+    rand = random.Random(2)
+    added = [f'추가{n}' for n in range(1000)]
+    start = time.perf_counter()
+    for term in added:
+        index.add(term)
+    add = (time.perf_counter() - start) / len(added) * 1e6
+    start = time.perf_counter()
+    for term in rand.sample(terms, 100):
+        index.remove(term)
+    remove = (time.perf_counter() - start) / 100 * 1e6
+    print(f'choseong add {add:.1f}us  remove {remove:,.0f}us')
+
+    qs = [''.join(Eng2Kor.ko_top[rand.randrange(19)] for _ in range(size)) for size in (1, 2, 2, 3, 3, 4) * 50]
+    start = time.perf_counter()
+    for q in qs:
+        index.search(q)
+    indexed = (time.perf_counter() - start) / len(qs) * 1e6
+
+    sample = qs[:3]
+    start = time.perf_counter()
+    for q in sample:
+        scan_choseong(terms, q)
+    scanned = (time.perf_counter() - start) / len(sample) * 1e6
+    print(f'choseong search  scan {scanned:,.0f}us  index {indexed:,.1f}us  x{scanned / indexed:,.0f}')
+
+
+def main(count: int = 1000000) -> None:
+    terms = catalog_terms(count)
+    layout(terms)
+    choseong(terms)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,89 @@
+"""
+로그인 공격 상황의 CPU 사용량 측정 (common/throttle.py)
+
+    python -m benchmark.bench_throttle [초당 시도 수] [측정 시간(초)] [IP 수]
+
+공격자가 IP 여러 개로 임의의 계정에 초당 시도 수만큼 로그인을 시도합니다.
+허용된 시도는 RSAUtility.decode + Bcrypt.verify(cost 10)를 실행하며, 처리가 밀린 경우 쉬지 않고 처리합니다.
+off : 제한 없음, on : LoginThrottle 기본 설정(IP 1/s, 최대 10회 / 계정 0.1/s, 최대 5회)
+cpu : 측정 시간 동안의 프로세스 CPU 사용률, sustained : 뒤쪽 절반 구간(처음 허용량 소진 후)의 CPU 사용률
+reject : 거부 1회당 시간
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from Crypto.PublicKey import RSA
+
+from common.auth import Bcrypt, RSAUtility
+from common.throttle import LoginThrottle, RateLimiter
+
+
+def attack(rsa: RSAUtility, throttle: LoginThrottle, rate: float, duration: float, ip_count: int) -> dict:
+    rand = random.Random(0)
+    password = rsa.encode('Passw0rd!!')
+    target = Bcrypt.encrypt('correct-password')
+    ips = [f'10.0.0.{n}' for n in range(ip_count)]
+
+    checked = rejected = 0
+    reject_time = 0.0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    sent = 0
+    half_cpu = None
+    while True:
+        elapsed = time.perf_counter() - wall
+        if elapsed >= duration:
+            break
+        if half_cpu is None and elapsed >= duration / 2:
+            half_cpu = time.process_time()
+        # 예정된 시도가 없으면 다음 시도 시간까지 대기
+        if sent >= elapsed * rate:
+            time.sleep(min(1 / rate, duration - elapsed))
+            continue
+        sent += 1
+
+        ip, account = rand.choice(ips), f'user{rand.randrange(100000)}'
+        if throttle is not None:
+            start = time.perf_counter()
+            if throttle.check(ip, account):
+                rejected += 1
+                reject_time += time.perf_counter() - start
+                continue
+        Bcrypt.verify(rsa.decode(password), target)
+        checked += 1
+
+    wall = time.perf_counter() - wall
+    end_cpu = time.process_time()
+    return {
+        'attempts': sent,
+        'checked': checked,
+        'rejected': rejected,
+        'cpu': (end_cpu - cpu) / wall * 100,
+        'sustained': (end_cpu - half_cpu) / (wall / 2) * 100,
+        'reject_us': reject_time / rejected * 1e6 if rejected else 0.0,
+    }
+
+
+def main(rate: float = 200, duration: float = 20, ip_count: int = 2) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        private_path = os.path.join(tmp, 'private.pem')
+        public_path = os.path.join(tmp, 'public.pem')
+        key = RSA.generate(2048)
+        with open(private_path, 'wb') as f:
+            f.write(key.export_key('PEM'))
+        with open(public_path, 'wb') as f:
+            f.write(key.public_key().export_key('PEM'))
+        rsa = RSAUtility(private_path, public_path)
+        Bcrypt.rounds = 10
+
+        for name, throttle in (('off', None), ('on', LoginThrottle(RateLimiter(1, 10), RateLimiter(0.1, 5)))):
+            result = attack(rsa, throttle, rate, duration, ip_count)
+            print(f'throttle {name:<4} {rate:.0f} attempts/s  cpu {result["cpu"]:5.1f}%  sustained {result["sustained"]:5.1f}%  '
+                  f'checked {result["checked"]:>6}  rejected {result["rejected"]:>6}  reject {result["reject_us"]:.1f}us')
+
+
+if __name__ == '__main__':
+    main(*(cast(arg) for cast, arg in zip((float, float, int), sys.argv[1:])))
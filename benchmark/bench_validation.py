@@ -0,0 +1,179 @@
+"""
+Validation 처리 속도 측정
+
+    python -m benchmark.bench_validation [반복횟수]
+
+chain  : 필드별 Validation.requireCheck + check* 호출
+schema : ValidationSchema로 컴파일한 검사 함수
+frame  : 업로드 파일 크기의 DataFrame, 셀 단위 Validation 호출과 checkFrame 처리량(rows/sec) 비교
+body   : 요청 body 파싱, str 필드 파싱 후 Validation 호출과 Validation pydantic 타입 파싱 비교
+"""
+import json
+import random
+import sys
+import time
+
+import pandas as pd
+from pydantic import BaseModel
+
+from common.validation import DateFormat, Email, Password, Validation, ValidationSchema, digits, regex
+
+
+# 50개 필드 (int, email, date, list, rex, passwd, list_values 반복)
+RULES = {}
+PAYLOAD = {}
+for i in range(50):
+    kind = i % 7
+    if kind == 0:
+        RULES[f'no_{i}'] = {'require': True, 'int': 3}
+        PAYLOAD[f'no_{i}'] = '123'
+    elif kind == 1:
+        RULES[f'email_{i}'] = {'require': True, 'email': True}
+        PAYLOAD[f'email_{i}'] = f'user{i}@example.com'
+    elif kind == 2:
+        RULES[f'date_{i}'] = {'date': True}
+        PAYLOAD[f'date_{i}'] = '2023-10-10'
+    elif kind == 3:
+        RULES[f'yn_{i}'] = {'require': True, 'list': ['Y', 'N']}
+        PAYLOAD[f'yn_{i}'] = 'Y'
+    elif kind == 4:
+        RULES[f'phone_{i}'] = {'rex': r'01\d-\d{3,4}-\d{4}$'}
+        PAYLOAD[f'phone_{i}'] = '010-1234-5678'
+    elif kind == 5:
+        RULES[f'passwd_{i}'] = {'passwd': True}
+        PAYLOAD[f'passwd_{i}'] = 'Passw0rd!!'
+    else:
+        RULES[f'category_{i}'] = {'list_values': ['물품', '용역', '공사']}
+        PAYLOAD[f'category_{i}'] = ['물품', '용역']
+
+
+def chain(data: dict) -> list:
+    """
+        기존 방식의 호출 체인, 모든 필드를 검사하여 오류를 모읍니다.
+    """
+    errors = []
+    for field, rule in RULES.items():
+        if rule.get('require') and Validation.requireCheck(data, [field]):
+            errors.append((field, 'require'))
+            continue
+        value = data.get(field)
+        if 'int' in rule and Validation.checkInt(value, rule['int']):
+            errors.append((field, 'int'))
+        if 'email' in rule and Validation.checkEmail(value):
+            errors.append((field, 'email'))
+        if 'date' in rule and Validation.checkDateFormat(value):
+            errors.append((field, 'date'))
+        if 'list' in rule and Validation.checkList(value, rule['list']):
+            errors.append((field, 'list'))
+        if 'rex' in rule and Validation.checkRex(value, rule['rex']):
+            errors.append((field, 'rex'))
+        if 'passwd' in rule and Validation.checkPasswd(value):
+            errors.append((field, 'passwd'))
+        if 'list_values' in rule and Validation.checkListValues(value, rule['list_values']):
+            errors.append((field, 'list_values'))
+    return errors
+
+
+FRAME_RULES = {
+    'email': {'require': True, 'email': True},
+    'join_date': {'date': True},
+    'user_no': {'int': 6},
+    'use_yn': {'list': ['Y', 'N']},
+}
+
+
+def upload_frame(rows: int) -> pd.DataFrame:
+    rand = random.Random(0)
+    return pd.DataFrame({
+        'email': [rand.choice(['user@example.com', 'a.b@test.co.kr', 'wrong@', '']) for _ in range(rows)],
+        'join_date': [rand.choice(['2023-10-10', '2023-02-30', '2023년1월3일', '2023.13.10']) for _ in range(rows)],
+        'user_no': [str(rand.randint(0, 2000000)) for _ in range(rows)],
+        'use_yn': [rand.choice(['Y', 'N', 'A']) for _ in range(rows)],
+    }, dtype=object)
+
+
+def cell_loop(df: pd.DataFrame) -> list:
+    """
+        셀 단위 Validation 호출
+    """
+    errors = []
+    for row, email, join_date, user_no, use_yn in df.itertuples(name=None):
+        if Validation.requireCheck({'email': email}, ['email']):
+            errors.append((row, 'email', 'require'))
+        elif Validation.checkEmail(email):
+            errors.append((row, 'email', 'email'))
+        if Validation.checkDateFormat(join_date):
+            errors.append((row, 'join_date', 'date'))
+        if Validation.checkInt(user_no, 6):
+            errors.append((row, 'user_no', 'int'))
+        if Validation.checkList(use_yn, ['Y', 'N']):
+            errors.append((row, 'use_yn', 'list'))
+    return errors
+
+
+class PlainBody(BaseModel):
+    user_no: str
+    email: str
+    join_date: str
+    passwd: str
+    phone: str
+
+
+class TypedBody(BaseModel):
+    user_no: digits(3)
+    email: Email
+    join_date: DateFormat
+    passwd: Password
+    phone: regex(r'01\d-\d{3,4}-\d{4}$')
+
+
+BODY = json.dumps({
+    'user_no': '123',
+    'email': 'user@example.com',
+    'join_date': '2023-10-10',
+    'passwd': 'Passw0rd!!',
+    'phone': '010-1234-5678',
+})
+
+
+def plain_body(body: str) -> bool:
+    data = PlainBody.model_validate_json(body)
+    return (Validation.checkInt(data.user_no, 3) or Validation.checkEmail(data.email)
+            or Validation.checkDateFormat(data.join_date) or Validation.checkPasswd(data.passwd)
+            or Validation.checkRex(data.phone, r'01\d-\d{3,4}-\d{4}$'))
+
+
+def _measure(func, data: dict, loop: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loop):
+        func(data)
+    return (time.perf_counter() - start) / loop * 1e6
+
+
+def main(loop: int = 5000) -> None:
+    schema = ValidationSchema(RULES)
+    invalid = dict(PAYLOAD, no_0='12', email_1='', yn_3='A')
+    for data in (PAYLOAD, invalid):
+        assert chain(data) == schema.validate(data)
+
+    for name, data in (('valid', PAYLOAD), ('invalid', invalid)):
+        before = _measure(chain, data, loop)
+        after = _measure(schema.validate, data, loop)
+        print(f'50 fields {name:<8} chain {before:7.1f} us  schema {after:7.1f} us  x{before / after:.1f}')
+
+    assert not plain_body(BODY)
+    before = _measure(plain_body, BODY, loop)
+    after = _measure(TypedBody.model_validate_json, BODY, loop)
+    print(f'body      plain+Validation {before:6.1f} us  typed {after:6.1f} us  x{before / after:.1f}')
+
+    df = upload_frame(100000)
+    _, report = Validation.checkFrame(df, FRAME_RULES)
+    assert sorted(cell_loop(df)) == sorted(report.itertuples(index=False, name=None))
+
+    before = len(df) / (_measure(cell_loop, df, 1) / 1e6)
+    after = len(df) / (_measure(lambda frame: Validation.checkFrame(frame, FRAME_RULES), df, 1) / 1e6)
+    print(f'{len(df)} rows  cells {before:,.0f} rows/s  frame {after:,.0f} rows/s  x{after / before:.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,261 @@
+"""
+common/ 모듈 벤치마크 실행 및 기준값 비교
+
+    python -m benchmark.run                                   # 전체 실행, 결과 출력
+    python -m benchmark.run -k validation                     # 이름에 validation이 포함된 항목만 실행
+    python -m benchmark.run -o result.json                    # 결과를 JSON으로 저장
+    python -m benchmark.run -b baseline.json --threshold 0.2  # 기준값보다 20% 이상 느린 항목이 있으면 exit 1
+
+각 항목은 호출당 시간(us)의 중앙값을 기록합니다. 네트워크 없이 실행되며 RSA 키는 임시 디렉터리에 생성합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from Crypto.PublicKey import RSA
+
+from common.auth import Bcrypt, JsonToken, RSAUtility
+from common.search import ChoseongIndex, LayoutSearchIndex
+from common.utiltiy import Eng2Kor, Eng2KorComposer
+from common.validation import Validation, ValidationSchema
+
+SHORT_KO = '안녕하세요'
+LONG_KO = '다람쥐 헌 쳇바퀴에 타고파 키스의 고유조건은 입술끼리 만나야 하고 특별한 기술은 필요치 않다 ' * 20
+SHORT_EN = Eng2Kor.conv_ko2en(SHORT_KO)
+LONG_EN = Eng2Kor.conv_ko2en(LONG_KO)
+
+
+def _once(setup):
+    """
+        setup을 처음 호출할 때 한번만 실행하고 결과를 재사용하는 함수 리턴\n
+        준비 비용이 큰 항목(RSA 키 생성, bcrypt 해시)이 -k로 제외된 경우 준비하지 않도록 사용합니다.
+        처음 호출은 measure의 준비 호출이므로 측정 시간에 포함되지 않습니다.
+    """
+    result = []
+
+    def get():
+        if not result:
+            result.append(setup())
+        return result[0]
+    return get
+
+
+def eng2kor_cases() -> dict:
+    composer = Eng2KorComposer()
+    keys = LONG_EN
+    position = [0]
+
+    def feed():
+        composer.feed(keys[position[0] % len(keys)])
+        position[0] += 1
+
+    rows = pd.Series([LONG_KO[i:i + 12] for i in range(0, len(LONG_KO), 12)] * 10, dtype=object)
+    return {
+        'eng2kor.conv_ko2en.short': lambda: Eng2Kor.conv_ko2en(SHORT_KO),
+        'eng2kor.conv_ko2en.long': lambda: Eng2Kor.conv_ko2en(LONG_KO),
+        'eng2kor.conv_en2ko.short': lambda: Eng2Kor.conv_en2ko(SHORT_EN),
+        'eng2kor.conv_en2ko.long': lambda: Eng2Kor.conv_en2ko(LONG_EN),
+        'eng2kor.split_ko.short': lambda: Eng2Kor.split_ko(SHORT_KO),
+        'eng2kor.split_en.short': lambda: Eng2Kor.split_en(SHORT_EN),
+        'eng2kor.composer.feed': feed,
+        'eng2kor.conv_ko2en_bulk.1k_rows': lambda: Eng2Kor.conv_ko2en_bulk(rows),
+    }
+
+
+def search_cases() -> dict:
+    words = [LONG_KO[i:i + size].strip() for size in (2, 4, 8) for i in range(0, len(LONG_KO) // 20, 2)]
+    layout = LayoutSearchIndex.build(words + ['iPhone', 'Galaxy'])
+    choseong = ChoseongIndex(words)
+    return {
+        'search.layout.hangul': lambda: layout.search('다람'),
+        'search.layout.keys': lambda: layout.search('ekfka'),
+        'search.choseong.prefix': lambda: choseong.search('ㄷㄹ'),
+        'search.choseong.substring': lambda: choseong.search('ㅊㅂ'),
+    }
+
+
+def validation_cases() -> dict:
+    schema = ValidationSchema({
+        'user_no': {'require': True, 'int': 3},
+        'email': {'require': True, 'email': True},
+        'join_date': {'date': True},
+        'use_yn': {'list': ['Y', 'N']},
+        'passwd': {'passwd': True},
+    })
+    data = {'user_no': '123', 'email': 'user@example.com', 'join_date': '2023-10-10', 'use_yn': 'Y', 'passwd': 'Passw0rd!!'}
+    frame = pd.DataFrame([data] * 1000, dtype=object)
+    return {
+        'validation.checkInt': lambda: Validation.checkInt('12345', 5),
+        'validation.checkRex': lambda: Validation.checkRex('010-1234-5678', r'01\d-\d{3,4}-\d{4}$'),
+        'validation.checkList': lambda: Validation.checkList('Y', ['Y', 'N']),
+        'validation.checkDateFormat.valid': lambda: Validation.checkDateFormat('2023-10-10'),
+        'validation.checkDateFormat.invalid': lambda: Validation.checkDateFormat('2023-13-10'),
+        'validation.checkEmail.valid': lambda: Validation.checkEmail('user@example.com'),
+        'validation.checkEmail.invalid': lambda: Validation.checkEmail('user@@example'),
+        'validation.checkPasswd.valid': lambda: Validation.checkPasswd('Passw0rd!!'),
+        'validation.checkPasswd.invalid': lambda: Validation.checkPasswd('Paaassw0rd!'),
+        'validation.requireCheck': lambda: Validation.requireCheck(data, ['user_no', 'email']),
+        'validation.checkListValues': lambda: Validation.checkListValues(['물품', '용역'], ['물품', '용역', '공사']),
+        'validation.schema.validate': lambda: schema.validate(data),
+        'validation.schema.validate_frame.1k_rows': lambda: schema.validate_frame(frame),
+    }
+
+
+def token_cases() -> dict:
+    JsonToken.JWT_KEY = 'benchmark-access-key-0123456789ab'
+    JsonToken.JWT_REFRESH_KEY = 'benchmark-refresh-key-0123456789a'
+    JsonToken.require_parameter = ['user_no']
+    token = JsonToken.encode_token({'user_no': 1})
+
+    def cached_decode():
+        JsonToken.claims_cache_size = 1000
+        try:
+            JsonToken.decode_token(token['access'])
+        finally:
+            JsonToken.claims_cache_size = 0
+
+    return {
+        'jsontoken.encode_token': lambda: JsonToken.encode_token({'user_no': 1}),
+        'jsontoken.decode_token.access': lambda: JsonToken.decode_token(token['access']),
+        'jsontoken.decode_token.refresh': lambda: JsonToken.decode_token(token['refresh'], False),
+        'jsontoken.decode_token.cached': cached_decode,
+    }
+
+
+def bcrypt_cases() -> dict:
+    target = _once(lambda: Bcrypt.encrypt('Passw0rd!!'))
+    return {
+        'bcrypt.encrypt': lambda: Bcrypt.encrypt('Passw0rd!!'),
+        'bcrypt.verify': lambda: Bcrypt.verify('Passw0rd!!', target()),
+    }
+
+
+def _rsa_setup(key_dir: str) -> dict:
+    private_path = os.path.join(key_dir, 'private.pem')
+    public_path = os.path.join(key_dir, 'public.pem')
+    key = RSA.generate(2048)
+    with open(private_path, 'wb') as f:
+        f.write(key.export_key('PEM'))
+    with open(public_path, 'wb') as f:
+        f.write(key.public_key().export_key('PEM'))
+
+    rsa = RSAUtility(private_path, public_path)
+    document = os.urandom(1024 * 1024)
+    return {
+        'rsa': rsa,
+        'encrypted': rsa.encode('Passw0rd!!'),
+        'fields': rsa.encode_many(['Passw0rd!!', '010-1234-5678', '900101-1234567']),
+        'document': document,
+        'en_document': rsa.encode_bytes(document),
+    }
+
+
+def rsa_cases(key_dir: str) -> dict:
+    state = _once(lambda: _rsa_setup(key_dir))
+    return {
+        'rsa.encode': lambda: state()['rsa'].encode('Passw0rd!!'),
+        'rsa.decode': lambda: state()['rsa'].decode(state()['encrypted']),
+        'rsa.decode_many.3_fields': lambda: state()['rsa'].decode_many(state()['fields']),
+        'rsa.encode_bytes.1mb': lambda: state()['rsa'].encode_bytes(state()['document']),
+        'rsa.decode_bytes.1mb': lambda: state()['rsa'].decode_bytes(state()['en_document']),
+    }
+
+
+def measure(func, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+        min_time 이상 걸리도록 반복 횟수를 정한 뒤 repeat번 측정하여 호출당 시간(us) 중앙값 리턴
+    """
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1000000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        'us_per_call': statistics.median(samples) * 1e6,
+        'min_us': min(samples) * 1e6,
+        'loops': loops,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+        기준값 대비 threshold 비율 이상 느려진 항목 리스트 리턴
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = result['us_per_call'] / base['us_per_call']
+        result['baseline_us'] = base['us_per_call']
+        result['ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description='common/ 모듈 벤치마크')
+    parser.add_argument('-k', '--filter', default='', help='이름에 포함된 항목만 실행')
+    parser.add_argument('-o', '--output', help='결과 JSON 저장 경로')
+    parser.add_argument('-b', '--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=0.2, help='허용하는 지연 증가 비율 (기본 0.2 = 20%%)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='측정 1회당 최소 시간(초)')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as key_dir:
+        cases = {}
+        for factory in (eng2kor_cases, search_cases, validation_cases, token_cases, bcrypt_cases, lambda: rsa_cases(key_dir)):
+            cases.update(factory())
+
+        results = {}
+        for name, func in cases.items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(func, args.repeat, args.min_time)
+            print(f'{name:<45}{results[name]["us_per_call"]:>14.2f} us', flush=True)
+    RSAUtility.shutdown_pool()
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name in regressions:
+            print(f'REGRESSION {name}: {results[name]["baseline_us"]:.2f} us -> {results[name]["us_per_call"]:.2f} us '
+                  f'(x{results[name]["ratio"]:.2f})')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': results,
+            }, f, indent=2)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,153 @@
 from datetime import datetime, timedelta
 from Crypto.PublicKey import RSA
-from Crypto.Cipher import PKCS1_v1_5 as Cipher_PKCS1_v1_5
+from Crypto.Cipher import AES, PKCS1_OAEP, PKCS1_v1_5 as Cipher_PKCS1_v1_5
+from Crypto.Hash import SHA256
+from Crypto.Random import get_random_bytes
 from base64 import b64encode, b64decode
+from collections import OrderedDict
+from contextlib import contextmanager
 import jwt
 import bcrypt
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import hashlib
+import heapq
+import json
+import multiprocessing
 import os
+import tempfile
+import threading
+import time
+import uuid
+
+
+@contextmanager
+def _file_lock(path: str):
+    """
+        프로세스 간 파일 lock, POSIX는 fcntl.flock, Windows는 msvcrt.locking을 사용합니다.
+    """
+    with open(path, 'a+') as lock_file:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:     # LK_LOCK은 10초 동안 재시도 후 실패
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+
+class TokenRevokedError(jwt.InvalidTokenError):
+    """
+        폐기된 토큰으로 디코드를 시도한 경우 발생
+    """
+
+
+# 토큰 폐기 목록
+class TokenDenylist():
+    """
+        폐기된 토큰의 jti 목록\n
+        jti -> exp 딕셔너리로 O(1) 조회하며, 항목은 토큰 만료 시간(exp)이 지나면 제거됩니다.\n
+        save, load로 파일에 저장하여 재시작 후에도 유지할 수 있습니다.
+    """
+    def __init__(self):
+        self._entries = {}      # jti -> exp
+        self._expiry = []       # (exp, jti) heap, 만료 항목 정리용
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, jti: str) -> bool:
+        exp = self._entries.get(jti)
+        return exp is not None and exp > time.time()
+
+    def add(self, jti: str, exp: float) -> bool:
+        """
+            토큰 폐기\n
+            jti : 토큰 ID\n
+            exp : 토큰 만료 시간(unix time), 이후 목록에서 제거됩니다.\n
+            이미 폐기된 jti인 경우 False 리턴, 확인과 추가는 lock 안에서 한번에 처리됩니다. (1회용 토큰 사용 처리)
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            current = self._entries.get(jti, 0)
+            if exp > current:
+                self._entries[jti] = exp
+                heapq.heappush(self._expiry, (exp, jti))
+            return current <= now
+
+    def _purge(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            exp, jti = heapq.heappop(self._expiry)
+            if self._entries.get(jti) == exp:
+                del self._entries[jti]
+
+    @staticmethod
+    def _read(path: str) -> dict:
+        # 파일이 없거나 손상된 경우 빈 목록으로 처리
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {jti: exp for jti, exp in data.items() if isinstance(exp, (int, float))}
+
+    def save(self, path: str) -> None:
+        """
+            만료되지 않은 항목을 파일로 저장\n
+            여러 워커 프로세스가 같은 파일에 저장할 수 있도록 파일 lock을 잡은 상태에서 기존 파일의 항목과 합친 뒤
+            프로세스별 임시 파일로 교체합니다.
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            data = dict(self._entries)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        with _file_lock(f'{path}.lock'):
+            for jti, exp in self._read(path).items():
+                if exp > max(now, data.get(jti, 0)):
+                    data[jti] = exp
+
+            fd, tmp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def load(self, path: str) -> None:
+        """
+            save로 저장한 파일을 읽어 목록에 추가\n
+            파일이 없거나 손상된 경우 무시합니다.
+        """
+        now = time.time()
+        for jti, exp in self._read(path).items():
+            if exp > now:
+                self.add(jti, exp)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
 
 
 # JWT 토큰
@@ -18,6 +161,10 @@ class JsonToken():
     JWT_REFRESH_KEY = ''    # refresh token 키
     require_parameter = [   # 토큰에 사용되는 변수 리스트
     ]
+    claims_cache_size = 0   # 검증된 토큰 캐시 크기, 0인 경우 캐시를 사용하지 않음
+    denylist = TokenDenylist()  # 폐기된 토큰 목록(프로세스 단위), None인 경우 폐기 여부를 확인하지 않음
+    _claims_cache = OrderedDict()
+    _claims_lock = threading.Lock()
 
     @classmethod
     def encode_token(cls, data: dict) -> dict:
@@ -35,6 +182,7 @@ class JsonToken():
         access_encoded = jwt.encode(
             dict({
                 'category': 'access',
+                'jti': uuid.uuid4().hex,
                 'exp': now_time + timedelta(minutes=cls.access_timeout)
             }, **parameters),
             cls.JWT_KEY,
@@ -43,6 +191,7 @@ class JsonToken():
         refresh_encode = jwt.encode(
             dict({
                 'category': 'refresh',
+                'jti': uuid.uuid4().hex,
                 'exp': now_time + timedelta(days=cls.refresh_timeout)
             }, **parameters),
             cls.JWT_REFRESH_KEY,
@@ -58,17 +207,134 @@ class JsonToken():
         """
             입력받은 토큰을 디코드\n
             token : 토큰 문자열\n
-            is_access : access token 여부 체크 (default -> True)
+            is_access : access token 여부 체크 (default -> True)\n
+            폐기된 토큰인 경우 TokenRevokedError 발생
         """
         key = cls.JWT_KEY if is_access else cls.JWT_REFRESH_KEY
-        return jwt.decode(token, key, algorithms='HS256')
+        if not cls.claims_cache_size:
+            return cls._check_revoked(jwt.decode(token, key, algorithms='HS256'))
+
+        # 토큰 원문 대신 digest를 저장하며, 키가 다르면 access/refresh 캐시가 분리됩니다.
+        cache_key = (key, hashlib.sha256(token.encode()).digest())
+        with cls._claims_lock:
+            entry = cls._claims_cache.get(cache_key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    cls._claims_cache.move_to_end(cache_key)
+                    return cls._check_revoked(dict(entry[1]))
+                del cls._claims_cache[cache_key]
+
+        claims = jwt.decode(token, key, algorithms='HS256')
+        exp = claims.get('exp')
+        if exp is not None:
+            with cls._claims_lock:
+                cls._claims_cache[cache_key] = (exp, claims)
+                while len(cls._claims_cache) > cls.claims_cache_size:
+                    cls._claims_cache.popitem(last=False)
+        return cls._check_revoked(dict(claims))
+
+    @classmethod
+    def _check_revoked(cls, claims: dict) -> dict:
+        if cls.denylist is not None and claims.get('jti') in cls.denylist:
+            raise TokenRevokedError('폐기된 토큰입니다.')
+        return claims
+
+    @classmethod
+    def revoke_token(cls, token: str, is_access: bool = True) -> None:
+        """
+            토큰 폐기\n
+            token : 토큰 문자열\n
+            is_access : access token 여부 체크 (default -> True)\n
+            서명이 유효하지 않은 토큰은 jwt.InvalidTokenError 발생, 이미 만료된 토큰은 무시합니다.\n
+            denylist는 프로세스 메모리에만 저장되므로 폐기는 이 요청을 처리한 워커 프로세스에만 적용됩니다.
+            여러 워커(WEB_WORKERS > 1)로 실행하는 경우 다른 워커에서는 토큰 만료(access_timeout) 또는 재시작
+            (TOKEN_DENYLIST_PATH 로드) 전까지 폐기된 토큰이 계속 유효합니다.
+        """
+        key = cls.JWT_KEY if is_access else cls.JWT_REFRESH_KEY
+        try:
+            claims = jwt.decode(token, key, algorithms='HS256')
+        except jwt.ExpiredSignatureError:
+            return
+        if cls.denylist is not None and claims.get('jti'):
+            cls.denylist.add(claims['jti'], claims['exp'])
+
+    @classmethod
+    def clear_claims_cache(cls) -> None:
+        """
+            검증된 토큰 캐시 비우기\n
+            JWT 키를 교체한 경우 호출합니다.
+        """
+        with cls._claims_lock:
+            cls._claims_cache.clear()
+
+
+class BcryptBusyError(RuntimeError):
+    """
+        비밀번호 해시 대기열이 가득 찬 경우 발생
+    """
 
 
 # 비밀번호 인코딩
 class Bcrypt():
     """
-        비밀번호 인코딩 및 비밀번호 검증
+        비밀번호 인코딩 및 비밀번호 검증\n
+        비동기 함수는 전용 스레드 풀에서 실행되며 max_workers, max_queue로 동시 실행 수와 대기열 크기를 제한합니다.\n
+        새 해시의 cost는 rounds를 따르며, calibrate로 서버 성능에 맞게 정할 수 있습니다.
     """
+    rounds = None       # 새 해시의 cost(log2 반복 횟수), None인 경우 bcrypt 기본값 12
+    min_rounds = 10     # calibrate가 선택하는 최소 cost
+    max_rounds = 16     # calibrate가 선택하는 최대 cost
+    max_workers = 4     # 해시 작업 동시 실행 수
+    max_queue = 64      # 실행 대기 가능한 최대 작업 수, 초과 시 BcryptBusyError
+    _executor = None
+    _lock = threading.Lock()
+    _pending = 0        # 대기 + 실행 중인 작업 수
+    _in_flight = 0      # 실행 중인 작업 수
+    _completed = 0
+    _rejected = 0
+    _wait_total = 0.0   # 대기열 대기 시간 합계, 초단위
+    _wait_max = 0.0
+
+    @classmethod
+    def current_rounds(cls) -> int:
+        """
+            새 해시에 사용하는 cost
+        """
+        return cls.rounds if cls.rounds is not None else 12
+
+    @classmethod
+    def cost(cls, target: str) -> int:
+        """
+            해시 문자열의 cost ('$2b$12$...' -> 12), 형식이 올바르지 않은 경우 None
+        """
+        try:
+            return int(target.split('$')[2])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
+    @classmethod
+    def calibrate(cls, target_ms: float = 250) -> int:
+        """
+            해시 1회가 target_ms 이하가 되는 가장 큰 cost를 측정하여 rounds에 설정\n
+            cost가 1 증가할 때마다 시간이 2배가 되므로 min_rounds에서 한번 측정하여 추정한 뒤, 선택한 cost로 다시 측정하여 확인합니다.\n
+            min_rounds 보다 작은 값은 선택하지 않습니다.\n
+            서버마다 결과가 다를 수 있으므로 여러 서버에서 같은 정책을 사용하려면 rounds를 직접 지정합니다.
+        """
+        def measure(rounds: int) -> float:
+            salt = bcrypt.gensalt(rounds)
+            start = time.perf_counter()
+            bcrypt.hashpw(b'calibrate', salt)
+            return (time.perf_counter() - start) * 1000
+
+        base = measure(cls.min_rounds)
+        rounds = cls.min_rounds
+        while rounds < cls.max_rounds and base * 2 ** (rounds + 1 - cls.min_rounds) <= target_ms:
+            rounds += 1
+        while rounds > cls.min_rounds and measure(rounds) > target_ms:
+            rounds -= 1
+        cls.rounds = rounds
+        return rounds
+
     @classmethod
     def encrypt(cls, pwd: str) -> str:
         """
@@ -77,7 +343,7 @@ class Bcrypt():
         """
         try:
             enc_pwd = pwd.encode('utf-8')
-            pwd_crypt = bcrypt.hashpw(enc_pwd, bcrypt.gensalt())
+            pwd_crypt = bcrypt.hashpw(enc_pwd, bcrypt.gensalt(cls.current_rounds()))
             pwd_crypt = pwd_crypt.decode('utf-8')
             return pwd_crypt
         except Exception:
@@ -96,6 +362,198 @@ class Bcrypt():
         except Exception:
             return False
 
+    @classmethod
+    def verify_and_update(cls, pwd: str, target: str) -> tuple:
+        """
+            비밀번호 검증 후 필요한 경우 새 해시 생성\n
+            (검증 결과, 새 해시) 튜플 리턴\n
+            비밀번호가 맞고 target의 cost가 현재 rounds와 다른 경우에만 새 해시를 생성하며, 그 외에는 None입니다.
+            새 해시를 저장하면 로그인하는 사용자부터 점진적으로 cost가 변경됩니다.
+        """
+        if not cls.verify(pwd, target):
+            return False, None
+        if cls.cost(target) == cls.current_rounds():
+            return True, None
+        return True, cls.encrypt(pwd)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix='bcrypt')
+        return cls._executor
+
+    @classmethod
+    def _run(cls, queued_at: float, func, *args):
+        wait = time.perf_counter() - queued_at
+        with cls._lock:
+            cls._in_flight += 1
+            cls._wait_total += wait
+            cls._wait_max = max(cls._wait_max, wait)
+        try:
+            return func(*args)
+        finally:
+            with cls._lock:
+                cls._in_flight -= 1
+                cls._completed += 1
+
+    @classmethod
+    def _done(cls, future) -> None:
+        with cls._lock:
+            cls._pending -= 1
+
+    @classmethod
+    async def _submit(cls, func, *args):
+        with cls._lock:
+            if cls._pending >= cls.max_workers + cls.max_queue:
+                cls._rejected += 1
+                raise BcryptBusyError('비밀번호 처리 대기열이 가득 찼습니다.')
+            cls._pending += 1
+
+        try:
+            future = cls._get_executor().submit(cls._run, time.perf_counter(), func, *args)
+        except BaseException:
+            cls._done(None)
+            raise
+        future.add_done_callback(cls._done)
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    async def encrypt_async(cls, pwd: str) -> str:
+        """
+            encrypt의 비동기 버전\n
+            대기열이 가득 찬 경우 BcryptBusyError 발생
+        """
+        return await cls._submit(cls.encrypt, pwd)
+
+    @classmethod
+    async def verify_async(cls, pwd: str, target: str) -> bool:
+        """
+            verify의 비동기 버전\n
+            대기열이 가득 찬 경우 BcryptBusyError 발생
+        """
+        return await cls._submit(cls.verify, pwd, target)
+
+    @classmethod
+    async def verify_and_update_async(cls, pwd: str, target: str) -> tuple:
+        """
+            verify_and_update의 비동기 버전\n
+            대기열이 가득 찬 경우 BcryptBusyError 발생
+        """
+        return await cls._submit(cls.verify_and_update, pwd, target)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+            비동기 해시 작업 현황\n
+            in_flight : 실행 중, queued : 대기 중, wait_avg_ms / wait_max_ms : 대기열 대기 시간
+        """
+        with cls._lock:
+            return {
+                'in_flight': cls._in_flight,
+                'queued': cls._pending - cls._in_flight,
+                'completed': cls._completed,
+                'rejected': cls._rejected,
+                'wait_avg_ms': cls._wait_total / cls._completed * 1000 if cls._completed else 0.0,
+                'wait_max_ms': cls._wait_max * 1000,
+            }
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+            비동기 해시 작업용 스레드 풀 종료
+        """
+        executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def _rsa_encrypt(cipher, txt: str) -> str:
+    return b64encode(cipher.encrypt(txt.encode())).decode('utf-8')
+
+
+def _rsa_decrypt(cipher, en_txt: str) -> str:
+    return cipher.decrypt(b64decode(en_txt), None).decode()
+
+
+def _rsa_init(key_paths: tuple) -> None:
+    """
+        프로세스 풀 initializer, 워커 시작 시 키를 미리 로드합니다.
+    """
+    for key_path in key_paths:
+        if key_path and os.path.exists(key_path):
+            RSAUtility._load_key(key_path)
+
+
+def _rsa_batch(key_path: str, mtime: int, is_decode: bool, items: list) -> list:
+    """
+        프로세스 풀 작업 함수\n
+        워커 프로세스마다 키를 캐시하며, 부모 프로세스가 사용하는 키의 mtime과 다른 경우 다시 로드합니다.
+        (reload_keys, invalidate_key로 키를 교체한 경우)
+    """
+    entry = RSAUtility._key_cache.get(key_path)
+    if entry is None or entry[0] != mtime:
+        entry = RSAUtility._load_key(key_path)
+    cipher = entry[2]
+    func = _rsa_decrypt if is_decode else _rsa_encrypt
+    return [func(cipher, item) for item in items]
+
+
+# 하이브리드 암호화 형식
+#   header : b'RSAG' + 버전(1) + 암호화된 AES 키 길이(2) + RSA-OAEP(SHA-256)로 암호화한 AES-256 키
+#   frame  : 암호문 길이(4) + AES-GCM 암호문 + tag(16), nonce는 frame 순번(11) + 마지막 frame 여부(1)
+# 모든 frame은 header를 associated data로 인증하며, 마지막 frame 여부를 nonce에 포함하여 잘린 스트림을 검출합니다.
+_HYBRID_MAGIC = b'RSAG\x01'
+_HYBRID_TAG_SIZE = 16
+
+
+def _hybrid_nonce(counter: int, final: bool) -> bytes:
+    return counter.to_bytes(11, 'big') + (b'\x01' if final else b'\x00')
+
+
+def _hybrid_seal(key: bytes, header: bytes, counter: int, final: bool, data) -> bytes:
+    cipher = AES.new(key, AES.MODE_GCM, nonce=_hybrid_nonce(counter, final))
+    cipher.update(header)
+    en_data, tag = cipher.encrypt_and_digest(data)
+    return len(en_data).to_bytes(4, 'big') + en_data + tag
+
+
+class _ChunkReader():
+    """
+        크기가 제각각인 bytes iterator에서 필요한 길이만큼 읽기
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buf = bytearray()
+        self._pos = 0
+
+    def read(self, size: int) -> bytes:
+        """
+            size 바이트 리턴, 입력이 끝난 경우에만 더 짧은 값을 리턴합니다.\n
+            입력 조각은 bytearray 뒤에 추가하고 읽은 부분은 read 호출마다 한번만 지우므로 작은 조각으로 나누어진 입력도 선형 시간에 처리합니다.
+        """
+        while len(self._buf) - self._pos < size:
+            piece = next(self._chunks, None)
+            if piece is None:
+                break
+            if self._pos:
+                del self._buf[:self._pos]
+                self._pos = 0
+            self._buf += piece
+        data = bytes(self._buf[self._pos:self._pos + size])
+        self._pos += len(data)
+        return data
+
+    def at_end(self) -> bool:
+        """
+            남은 데이터가 없는지 확인, 읽는 위치는 바뀌지 않습니다.
+        """
+        if not self.read(1):
+            return True
+        self._pos -= 1
+        return False
+
 
 # RSA 암호화 모듈
 class RSAUtility():
@@ -104,21 +562,82 @@ class RSAUtility():
         private_path : 개인키 경로\n
         public_path : 공개키 경로
     """
+    _key_cache = {}                 # 키 경로별 (mtime, key, cipher) 캐시
+    _key_lock = threading.Lock()    # 캐시 갱신용 lock
+    parallel_threshold = 64         # 일괄 처리 시 프로세스 풀을 사용할 최소 건수
+    pool_workers = os.cpu_count() or 1  # 프로세스 풀 크기
+    stream_chunk_size = 64 * 1024   # 하이브리드 암호화 frame 크기
+    stream_max_frame = 16 * 1024 * 1024     # 복호화 시 허용하는 최대 frame 크기
+    _process_pool = None
+
     def __init__(self, private_path: str = None, public_path: str = None):
         self.private_path = private_path
         self.public_path = public_path
 
-    def setting_key(self, key_path: str) -> object:
+    @classmethod
+    def _load_key(cls, key_path: str) -> tuple:
         """
-            키 파일 로드
+            키 파일을 읽어 캐시에 등록\n
+            (mtime, key, cipher) 튜플을 리턴
         """
         if not os.path.exists(key_path):
             raise FileNotFoundError('KEY 파일이 존재하지 않습니다.')
 
+        mtime = os.stat(key_path).st_mtime_ns
         with open(key_path, 'r') as k_file:
             _k = k_file.read()
             k = RSA.importKey(_k)
-        return k
+
+        entry = (mtime, k, Cipher_PKCS1_v1_5.new(k))
+        with cls._key_lock:
+            cls._key_cache[key_path] = entry
+        return entry
+
+    @classmethod
+    def _cached_key(cls, key_path: str) -> tuple:
+        """
+            캐시된 (mtime, key, cipher) 튜플을 리턴\n
+            캐시에 없는 경우에만 파일을 읽습니다.
+        """
+        entry = cls._key_cache.get(key_path)
+        if entry is None:
+            entry = cls._load_key(key_path)
+        return entry
+
+    def setting_key(self, key_path: str) -> object:
+        """
+            키 파일 로드\n
+            한번 로드된 키는 프로세스 내에 캐시되며, 이후에는 파일을 다시 읽지 않습니다.
+        """
+        return self._cached_key(key_path)[1]
+
+    def reload_keys(self, force: bool = False) -> bool:
+        """
+            객체에 설정된 키 파일의 mtime을 확인하여 변경된 키를 다시 로드\n
+            force : mtime과 관계없이 다시 로드\n
+            키가 하나라도 다시 로드되면 True 리턴
+        """
+        reloaded = False
+        for key_path in (self.private_path, self.public_path):
+            if not key_path:
+                continue
+            entry = self._key_cache.get(key_path)
+            if force or entry is None or entry[0] != os.stat(key_path).st_mtime_ns:
+                self._load_key(key_path)
+                reloaded = True
+        return reloaded
+
+    @classmethod
+    def invalidate_key(cls, key_path: str = None) -> None:
+        """
+            캐시된 키 제거\n
+            key_path : 제거할 키 경로, 입력하지 않는 경우 전체 캐시를 비웁니다.
+        """
+        with cls._key_lock:
+            if key_path is None:
+                cls._key_cache.clear()
+            else:
+                cls._key_cache.pop(key_path, None)
 
     def make_private_key(self, path: str = None) -> None:
         """
@@ -169,22 +688,157 @@ class RSAUtility():
             일반 텍스트를 암호화된 텍스트로 변경\n
             public key는 클래스 생성 시 입력한 경로를 따릅니다.
         """
-        keyPub = self.setting_key(self.public_path)
-        cipher = Cipher_PKCS1_v1_5.new(keyPub)
-        cipher_text = cipher.encrypt(txt.encode())
-        emsg = b64encode(cipher_text)
-        encryptedText = emsg.decode('utf-8')
-
-        return encryptedText
+        cipher = self._cached_key(self.public_path)[2]
+        return _rsa_encrypt(cipher, txt)
 
     def decode(self, en_txt: str) -> str:
         """
             암호화된 텍스트를 일반 텍스트로 변경해줍니다.\n
             private key는 클래스 생성 시 입력한 경로를 따릅니다.
         """
-        encoded_msg = b64decode(en_txt)
-        pr_key = self.setting_key(self.private_path)
-        cipher = Cipher_PKCS1_v1_5.new(pr_key)
-        decrypt_text = cipher.decrypt(encoded_msg, None).decode()
+        cipher = self._cached_key(self.private_path)[2]
+        return _rsa_decrypt(cipher, en_txt)
 
-        return decrypt_text
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        # 스레드가 있는 프로세스(uvicorn, run_in_executor)에서 fork하지 않도록 spawn으로 워커 생성
+        cls = type(self)
+        if cls._process_pool is None:
+            with cls._key_lock:
+                if cls._process_pool is None:
+                    cls._process_pool = ProcessPoolExecutor(
+                        max_workers=cls.pool_workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_rsa_init,
+                        initargs=((self.private_path, self.public_path),),
+                    )
+        return cls._process_pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """
+            일괄 처리에 사용한 프로세스 풀 종료
+        """
+        pool, cls._process_pool = cls._process_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _run_many(self, key_path: str, is_decode: bool, items) -> list:
+        items = list(items)
+        mtime = self._cached_key(key_path)[0]
+        if len(items) < self.parallel_threshold or self.pool_workers < 2:
+            return _rsa_batch(key_path, mtime, is_decode, items)
+
+        # 워커별 키 로드 비용을 줄이기 위해 워커 수 단위로 묶어서 전달
+        size = -(-len(items) // (self.pool_workers * 4))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        pool = self._get_process_pool()
+        result = []
+        for part in pool.map(_rsa_batch, [key_path] * len(chunks), [mtime] * len(chunks), [is_decode] * len(chunks), chunks):
+            result.extend(part)
+        return result
+
+    def encode_many(self, txts: list) -> list:
+        """
+            여러 텍스트를 한번에 암호화\n
+            parallel_threshold 이상인 경우 프로세스 풀에서 나누어 처리합니다.
+        """
+        return self._run_many(self.public_path, False, txts)
+
+    def decode_many(self, en_txts: list) -> list:
+        """
+            암호화된 여러 텍스트를 한번에 복호화\n
+            parallel_threshold 이상인 경우 프로세스 풀에서 나누어 처리합니다.
+        """
+        return self._run_many(self.private_path, True, en_txts)
+
+    async def encode_many_async(self, txts: list) -> list:
+        """
+            encode_many의 비동기 버전, 이벤트 루프를 막지 않도록 executor에서 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.encode_many, txts)
+
+    async def decode_many_async(self, en_txts: list) -> list:
+        """
+            decode_many의 비동기 버전, 이벤트 루프를 막지 않도록 executor에서 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.decode_many, en_txts)
+
+    def encode_stream(self, chunks, chunk_size: int = None):
+        """
+            RSA + AES-GCM 하이브리드 암호화 generator\n
+            메시지마다 AES-256 키를 만들어 공개키(RSA-OAEP)로 암호화하고, 데이터는 chunk_size 단위 frame으로 AES-GCM 암호화합니다.\n
+            chunks : bytes iterator (파일인 경우 iter(functools.partial(f.read, 65536), b''))\n
+            header, frame bytes를 순서대로 생성하며 메모리는 chunk_size 정도만 사용합니다.
+        """
+        chunk_size = chunk_size or self.stream_chunk_size
+        key = get_random_bytes(32)
+        wrapped = PKCS1_OAEP.new(self._cached_key(self.public_path)[1], hashAlgo=SHA256).encrypt(key)
+        header = _HYBRID_MAGIC + len(wrapped).to_bytes(2, 'big') + wrapped
+        yield header
+
+        counter = 0
+        pending = bytearray()
+        for piece in chunks:
+            pending += piece
+            if len(pending) <= chunk_size:
+                continue
+            # 마지막 frame 표시를 위해 chunk_size 이하의 데이터는 다음 입력이 올 때까지 보관
+            start = 0
+            with memoryview(pending) as view:
+                while len(pending) - start > chunk_size:
+                    yield _hybrid_seal(key, header, counter, False, view[start:start + chunk_size])
+                    start += chunk_size
+                    counter += 1
+            del pending[:start]
+        yield _hybrid_seal(key, header, counter, True, bytes(pending))
+
+    def decode_stream(self, chunks):
+        """
+            encode_stream으로 암호화한 데이터를 복호화하는 generator\n
+            chunks : 암호화된 bytes iterator, 나누어진 크기는 encode_stream의 frame과 달라도 됩니다.\n
+            frame 단위로 인증 후 평문을 생성하며, 위조되거나 잘린 데이터는 ValueError가 발생합니다.
+            잘린 데이터는 마지막 frame에서 검출되므로 generator를 끝까지 읽은 뒤 결과를 사용해야 합니다.
+        """
+        reader = _ChunkReader(chunks)
+        prefix = reader.read(len(_HYBRID_MAGIC) + 2)
+        if len(prefix) < len(_HYBRID_MAGIC) + 2 or not prefix.startswith(_HYBRID_MAGIC):
+            raise ValueError('하이브리드 암호화 형식이 아닙니다.')
+        wrapped = reader.read(int.from_bytes(prefix[-2:], 'big'))
+        header = prefix + wrapped
+        key = PKCS1_OAEP.new(self._cached_key(self.private_path)[1], hashAlgo=SHA256).decrypt(wrapped)
+
+        counter = 0
+        while True:
+            size = reader.read(4)
+            if len(size) < 4:
+                raise ValueError('암호화된 데이터가 잘렸습니다.')
+            size = int.from_bytes(size, 'big')
+            if size > self.stream_max_frame:
+                raise ValueError('frame 크기가 허용 범위를 넘었습니다.')
+            frame = reader.read(size + _HYBRID_TAG_SIZE)
+            if len(frame) < size + _HYBRID_TAG_SIZE:
+                raise ValueError('암호화된 데이터가 잘렸습니다.')
+
+            # 마지막 frame 여부는 nonce에 포함되어 있으므로, 데이터가 남아 있는지로 판단한 뒤 인증으로 확인
+            final = reader.at_end()
+            cipher = AES.new(key, AES.MODE_GCM, nonce=_hybrid_nonce(counter, final))
+            cipher.update(header)
+            yield cipher.decrypt_and_verify(frame[:size], frame[size:])
+            if final:
+                return
+            counter += 1
+
+    def encode_bytes(self, data: bytes) -> bytes:
+        """
+            encode_stream으로 bytes 전체를 암호화\n
+            encode와 달리 길이 제한이 없습니다.
+        """
+        return b''.join(self.encode_stream([data]))
+
+    def decode_bytes(self, en_data: bytes) -> bytes:
+        """
+            encode_bytes, encode_stream으로 암호화한 bytes 전체를 복호화
+        """
+        return b''.join(self.decode_stream([en_data]))
@@ -0,0 +1,280 @@
+"""
+PostgreSQL 연결 풀 및 대량 입력/조회
+
+    from common.db import Database, get_connection
+
+    @app.post('/users')
+    def create_user(conn=Depends(get_connection)):
+        with conn.cursor() as cur:
+            ...
+        conn.commit()
+
+환경변수
+    DB_DSN                  : 접속 문자열 (예: 'host=localhost dbname=app user=app password=...')
+    DB_POOL_MIN, DB_POOL_MAX : 연결 풀 최소/최대 연결 수 (기본값 1, 10)
+    DB_POOL_TIMEOUT         : 연결 대기 시간, 초단위 (기본값 30)
+"""
+from contextlib import asynccontextmanager, contextmanager
+import io
+import os
+import threading
+
+from anyio import to_thread
+import numpy as np
+from psycopg2 import extensions, extras, sql
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+
+class PoolTimeoutError(PoolError):
+    """
+        연결 풀에서 DB_POOL_TIMEOUT 안에 연결을 받지 못한 경우 발생
+    """
+
+
+def _csv_value(value) -> str:
+    # NULL은 따옴표 없는 빈 값, 그 외 값은 모두 따옴표로 감싸 빈 문자열과 NULL을 구분합니다.
+    if value is None:
+        return ''
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _frame_rows(df, columns: list, chunk_rows: int):
+    """
+        DataFrame을 chunk_rows 단위로 꺼내 행 튜플로 생성, NaN/None/pd.NA는 None으로 변환합니다.\n
+        빈 값이 있어 float로 바뀐 정수 컬럼은 Int64로 되돌려 '1.0'이 아닌 '1'로 입력되도록 합니다.
+    """
+    integral = []
+    for column in columns:
+        series = df[column]
+        if series.dtype.kind == 'f':
+            values = series.dropna().to_numpy()
+            if np.isfinite(values).all() and (values == np.round(values)).all():
+                integral.append(column)
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows][columns]
+        if integral:
+            chunk = chunk.astype({column: 'Int64' for column in integral})
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+class _CsvStream(io.TextIOBase):
+    """
+        행 iterator를 COPY FROM STDIN에 전달하기 위한 읽기 전용 CSV 스트림\n
+        copy_expert가 read를 호출할 때마다 필요한 만큼만 행을 CSV로 변환합니다.
+    """
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._pending = ''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        lines = [self._pending]
+        length = len(self._pending)
+        for row in self._rows:
+            line = ','.join(map(_csv_value, row)) + '\n'
+            lines.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = ''.join(lines)
+
+        if size < 0:
+            self._pending = ''
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+
+class Database():
+    """
+        프로세스 단위 PostgreSQL 연결 풀\n
+        풀은 처음 사용할 때 생성되며, fork된 워커 프로세스에서는 새로 생성합니다.\n
+        연결 수가 maxconn에 도달하면 timeout 동안 반납을 기다린 뒤 PoolTimeoutError를 발생시킵니다.
+    """
+    def __init__(self, dsn: str = None, minconn: int = None, maxconn: int = None, timeout: float = None):
+        self.dsn = dsn if dsn is not None else os.getenv('DB_DSN', '')
+        self.minconn = minconn if minconn is not None else int(os.getenv('DB_POOL_MIN', 1))
+        self.maxconn = maxconn if maxconn is not None else int(os.getenv('DB_POOL_MAX', 10))
+        self.timeout = timeout if timeout is not None else float(os.getenv('DB_POOL_TIMEOUT', 30))
+        self._pool = None
+        self._pid = None
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        if self._pool is None or self._pid != os.getpid():
+            with self._lock:
+                if self._pool is None or self._pid != os.getpid():
+                    self._pool = ThreadedConnectionPool(self.minconn, self.maxconn, self.dsn)
+                    self._slots = threading.BoundedSemaphore(self.maxconn)
+                    self._pid = os.getpid()
+        return self._pool
+
+    def getconn(self):
+        """
+            연결 체크아웃, 사용 후 반드시 putconn으로 반납합니다.
+        """
+        pool = self._get_pool()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError('DB 연결을 받지 못했습니다.')
+        try:
+            return pool.getconn()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """
+            연결 반납, 트랜잭션이 남아 있는 경우 rollback 합니다.
+        """
+        try:
+            if not conn.closed and conn.status != extensions.STATUS_READY:
+                conn.rollback()
+            self._pool.putconn(conn, close=close or bool(conn.closed))
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+            with db.connection() as conn: 블록이 정상 종료되면 commit, 예외 발생 시 rollback 합니다.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    @asynccontextmanager
+    async def connection_async(self):
+        """
+            connection의 비동기 버전\n
+            연결 대기와 commit/rollback은 스레드 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+        """
+        conn = await to_thread.run_sync(self.getconn)
+        try:
+            yield conn
+            await to_thread.run_sync(conn.commit)
+        except BaseException:
+            if not conn.closed:
+                await to_thread.run_sync(conn.rollback)
+            raise
+        finally:
+            await to_thread.run_sync(self.putconn, conn)
+
+    def close(self) -> None:
+        """
+            풀의 모든 연결 종료
+        """
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.closeall()
+            self._pool = None
+
+    def execute_values(self, query: str, rows, page_size: int = 1000, conn=None) -> int:
+        """
+            psycopg2.extras.execute_values로 여러 행을 한번에 입력\n
+            query : 'INSERT INTO t (a, b) VALUES %s' 형식\n
+            conn : 입력하지 않는 경우 풀에서 연결을 받아 commit 합니다.\n
+            입력한 행 수 리턴
+        """
+        if conn is None:
+            with self.connection() as conn:
+                return self.execute_values(query, rows, page_size, conn)
+
+        count = 0
+        with conn.cursor() as cur:
+            rows = iter(rows)
+            while True:
+                page = [row for _, row in zip(range(page_size * 10), rows)]
+                if not page:
+                    break
+                extras.execute_values(cur, query, page, page_size=page_size)
+                count += len(page)
+        return count
+
+    def copy_rows(self, table: str, columns: list, rows, conn=None) -> int:
+        """
+            COPY FROM STDIN으로 행 iterator를 스트리밍 입력\n
+            rows는 필요한 만큼만 CSV로 변환되므로 전체를 메모리에 올리지 않습니다.\n
+            None은 NULL로 입력됩니다.
+        """
+        if conn is None:
+            with self.connection() as conn:
+                return self.copy_rows(table, columns, rows, conn)
+
+        query = sql.SQL('COPY {} ({}) FROM STDIN WITH (FORMAT csv)').format(
+            sql.Identifier(*table.split('.')),
+            sql.SQL(', ').join(map(sql.Identifier, columns)),
+        )
+        with conn.cursor() as cur:
+            cur.copy_expert(query, _CsvStream(rows))
+            return cur.rowcount
+
+    def copy_frame(self, table: str, df, columns: list = None, chunk_rows: int = 50000, conn=None) -> int:
+        """
+            DataFrame을 COPY FROM STDIN으로 입력\n
+            columns : 입력할 컬럼, 입력하지 않는 경우 df의 전체 컬럼\n
+            chunk_rows 단위로 행을 꺼내 변환하므로 CSV 전체를 메모리에 만들지 않습니다.\n
+            NaN/None은 NULL로 입력됩니다.
+        """
+        columns = list(columns if columns is not None else df.columns)
+        return self.copy_rows(table, columns, _frame_rows(df, columns, chunk_rows), conn)
+
+    def stream(self, query: str, params=None, itersize: int = 2000):
+        """
+            서버 측 cursor로 대용량 조회 결과를 itersize 단위로 가져오는 generator\n
+            반복이 끝날 때까지 연결을 사용하며, 종료 시 연결을 반납합니다.
+        """
+        with self.connection() as conn:
+            with conn.cursor(name=f'stream_{id(conn)}_{threading.get_ident()}') as cur:
+                cur.itersize = itersize
+                cur.execute(query, params)
+                yield from cur
+
+
+# 기본 연결 풀, DB_* 환경변수 설정을 사용
+db = Database()
+
+
+def get_db() -> Database:
+    """
+        FastAPI dependency, 기본 연결 풀 리턴
+    """
+    return db
+
+
+def get_connection():
+    """
+        FastAPI dependency, 요청 동안 연결을 사용하고 응답 후 반납합니다.\n
+        dependency의 yield 이후 코드는 응답을 보낸 뒤 실행되므로 자동으로 commit하지 않습니다.
+        입력/수정하는 route는 리턴 전에 conn.commit()을 호출해야 하며, commit 실패는 오류 응답이 됩니다.
+        commit하지 않은 트랜잭션은 반납 시 rollback 됩니다.\n
+        sync generator dependency이므로 FastAPI가 스레드 풀에서 실행하여 연결 대기가 이벤트 루프를 막지 않습니다.
+    """
+    conn = db.getconn()
+    try:
+        yield conn
+    finally:
+        db.putconn(conn)
+
+
+async def get_connection_async():
+    """
+        async route용 FastAPI dependency, get_connection과 같이 자동으로 commit하지 않습니다.\n
+        route에서 await to_thread.run_sync(conn.commit)으로 commit 합니다.
+    """
+    conn = await to_thread.run_sync(db.getconn)
+    try:
+        yield conn
+    finally:
+        await to_thread.run_sync(db.putconn, conn)
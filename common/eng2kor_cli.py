@@ -0,0 +1,183 @@
+"""
+대용량 파일 한/영 자판 변환
+
+    python -m common.eng2kor_cli ko2en dump.txt -o dump.keys.txt
+    python -m common.eng2kor_cli en2ko export.log -o export.ko.log --workers 8 --chunk-mb 8
+    cat export.log | python -m common.eng2kor_cli en2ko - > export.ko.log
+
+입력을 줄 단위로 나눈 chunk-mb 크기의 chunk로 읽어 프로세스 풀에서 변환하고, 입력 순서대로 출력합니다.
+처리 중인 chunk는 워커 수의 2배로 제한되므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+(chunk-mb보다 긴 줄은 나누지 않으므로 chunk 크기는 chunk-mb와 가장 긴 줄 중 큰 값입니다.)
+진행률과 처리 속도(MB/s)는 stderr로 출력합니다.
+"""
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+
+from common.utiltiy import Eng2Kor
+
+
+def _convert(mode: str, encoding: str, chunk: bytes) -> bytes:
+    """
+        프로세스 풀 작업 함수, 줄 단위로 나누어진 chunk 변환\n
+        conv_en2ko, conv_ko2en은 줄바꿈을 넘어 글자를 조합하지 않으므로 chunk 전체를 한번에 변환합니다.
+    """
+    func = Eng2Kor.conv_ko2en if mode == 'ko2en' else Eng2Kor.conv_en2ko
+    return func(chunk.decode(encoding)).encode(encoding)
+
+
+def check_encoding(encoding: str) -> str:
+    """
+        줄 단위로 나눌 수 있는 인코딩인지 확인\n
+        입력을 b'\\n' 바이트로 나누고 chunk마다 따로 인코딩하므로, ASCII 문자를 같은 바이트로 인코딩하고 BOM을 붙이지 않는
+        인코딩(utf-8, cp949, euc-kr 등)만 사용할 수 있습니다. utf-16, utf-32, utf-8-sig는 ValueError
+    """
+    try:
+        sample = 'a\n'.encode(encoding)
+    except LookupError:
+        raise ValueError(f'알 수 없는 인코딩입니다. ({encoding})')
+    if sample != b'a\n':
+        raise ValueError(f'ASCII 호환 인코딩만 사용할 수 있습니다. ({encoding})')
+    return encoding
+
+
+def _encoding_arg(encoding: str) -> str:
+    try:
+        return check_encoding(encoding)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def read_chunks(stream, chunk_size: int):
+    """
+        stream을 chunk_size 내외의 bytes로 나누어 생성, 각 chunk는 줄바꿈으로 끝납니다. (마지막 chunk 제외)\n
+        한 줄이 chunk_size보다 긴 경우 그 줄이 끝날 때까지 하나의 chunk로 읽습니다.\n
+        줄바꿈이 없는 block은 리스트에 모아 두고 새로 읽은 block에서만 줄바꿈을 찾으므로 긴 줄도 선형 시간에 처리합니다.
+    """
+    pieces = []     # 아직 줄바꿈으로 끝나지 않은 block
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        end = block.rfind(b'\n') + 1
+        if end == 0:
+            pieces.append(block)
+            continue
+        pieces.append(block[:end])
+        yield b''.join(pieces)
+        pieces = [block[end:]] if end < len(block) else []
+    if pieces:
+        yield b''.join(pieces)
+
+
+class Progress():
+    """
+        진행률, 처리 속도를 stderr로 출력\n
+        interval초마다 한번씩 출력하며, total을 모르는 경우(stdin) 처리한 크기만 출력합니다.
+    """
+    def __init__(self, total: int = None, interval: float = 1.0, stream=sys.stderr):
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.done = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def update(self, size: int) -> None:
+        self.done += size
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            self._print(now, '\r')
+
+    def finish(self) -> None:
+        self._print(time.perf_counter(), '\r')
+        self.stream.write('\n')
+        self.stream.flush()
+
+    def _print(self, now: float, end: str) -> None:
+        mb = self.done / 1024 / 1024
+        speed = mb / max(now - self.start, 1e-9)
+        if self.total:
+            line = f'{mb:,.1f} / {self.total / 1024 / 1024:,.1f} MB ({self.done / self.total * 100:5.1f}%)'
+        else:
+            line = f'{mb:,.1f} MB'
+        self.stream.write(f'{end}{line}  {speed:,.1f} MB/s  {now - self.start:,.1f}s')
+        self.stream.flush()
+
+
+def convert_stream(mode: str, source, target, workers: int = None, chunk_size: int = 4 * 1024 * 1024,
+                   encoding: str = 'utf-8', progress: Progress = None) -> int:
+    """
+        source(bytes 읽기 stream)를 변환하여 target(bytes 쓰기 stream)에 입력 순서대로 출력\n
+        mode : ko2en 또는 en2ko\n
+        workers : 프로세스 수, 1인 경우 현재 프로세스에서 변환\n
+        읽은 입력 크기(bytes) 리턴
+    """
+    check_encoding(encoding)
+    workers = workers or os.cpu_count() or 1
+    chunks = read_chunks(source, chunk_size)
+    total = 0
+
+    if workers == 1:
+        for chunk in chunks:
+            target.write(_convert(mode, encoding, chunk))
+            total += len(chunk)
+            if progress is not None:
+                progress.update(len(chunk))
+        return total
+
+    pending = deque()   # (입력 크기, future), 입력 순서 유지
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                size, future = pending.popleft()
+                target.write(future.result())
+                total += size
+                if progress is not None:
+                    progress.update(size)
+            pending.append((len(chunk), pool.submit(_convert, mode, encoding, chunk)))
+
+        while pending:
+            size, future = pending.popleft()
+            target.write(future.result())
+            total += size
+            if progress is not None:
+                progress.update(size)
+    return total
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description='대용량 파일 한/영 자판 변환')
+    parser.add_argument('mode', choices=['ko2en', 'en2ko'], help='ko2en : 한글 -> 자판 입력, en2ko : 자판 입력 -> 한글')
+    parser.add_argument('input', help="입력 파일 경로, '-'인 경우 stdin")
+    parser.add_argument('-o', '--output', default='-', help="출력 파일 경로, 입력하지 않거나 '-'인 경우 stdout")
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본값 CPU 개수)')
+    parser.add_argument('--chunk-mb', type=float, default=4, help='chunk 크기, MB 단위 (기본값 4)')
+    parser.add_argument('--encoding', type=_encoding_arg, default='utf-8', help='ASCII 호환 인코딩 (utf-8, cp949 등)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='진행률을 출력하지 않음')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    target = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    total = None if args.input == '-' else os.path.getsize(args.input)
+    progress = None if args.quiet else Progress(total)
+    try:
+        convert_stream(args.mode, source, target, args.workers, int(args.chunk_mb * 1024 * 1024), args.encoding, progress)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+        else:
+            target.flush()
+    if progress is not None:
+        progress.finish()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Prometheus 텍스트 형식 지표 수집
+
+    registry = MetricsRegistry()
+    instrument(registry)        # common/auth.py, common/validation.py 진입 함수에 타이머 연결
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    registry.render()           # /metrics 응답 본문
+
+instrument를 호출하지 않으면 원본 함수가 그대로 사용되므로 비활성 상태의 부하는 없습니다.
+"""
+from bisect import bisect_left
+import functools
+import threading
+import time
+
+from common.auth import Bcrypt, JsonToken, RSAUtility
+from common.validation import Validation
+
+# 요청/함수 지연시간 histogram 구간, 초단위
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _raised(result) -> bool:
+    return False
+
+
+def _truthy(result) -> bool:
+    return bool(result)
+
+
+def _not_none(result) -> bool:
+    return result is not None
+
+
+# 계측 대상 함수 -> 반환값으로 실패를 판단하는 함수, 예외는 항상 실패로 집계
+INSTRUMENT_TARGETS = {
+    JsonToken: {
+        'encode_token': _raised,
+        'decode_token': _raised,
+    },
+    Bcrypt: {
+        'encrypt': lambda result: result is None,
+        'verify': lambda result: result is False,
+        'verify_and_update': lambda result: result[0] is False,
+    },
+    RSAUtility: {
+        'encode': _raised,
+        'decode': _raised,
+        'encode_many': _raised,
+        'decode_many': _raised,
+    },
+    Validation: {
+        'checkInt': _truthy,
+        'checkRex': _truthy,
+        'checkNamed': _truthy,
+        'checkList': _truthy,
+        'checkDateFormat': _truthy,
+        'checkEmail': _truthy,
+        'checkPasswd': _truthy,
+        'checkListValues': _truthy,
+        'requireCheck': _not_none,
+    },
+}
+
+
+class MetricsRegistry():
+    """
+        counter, histogram 저장소\n
+        label은 (key, value) 튜플의 튜플로 전달합니다.
+    """
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters = {}     # name -> {labels: value}
+        self._histograms = {}   # name -> {labels: [bucket counts..., sum, count]}
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, kind: str, text: str) -> None:
+        """
+            지표 설명 등록\n
+            kind : counter 또는 histogram
+        """
+        self._help[name] = (kind, text)
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + value
+
+    def observe(self, name: str, value: float, labels: tuple = ()) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            data = series.get(labels)
+            if data is None:
+                data = series[labels] = [0] * (len(self.buckets) + 3)
+            data[idx] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def render(self) -> str:
+        """
+            Prometheus 텍스트 형식(0.0.4)으로 출력
+        """
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.extend(self._header(name, 'counter'))
+                for labels, value in series.items():
+                    lines.append(f'{name}{_labels(labels)} {value}')
+
+            for name, series in sorted(self._histograms.items()):
+                lines.extend(self._header(name, 'histogram'))
+                for labels, data in series.items():
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, data):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{_labels(labels + (("le", repr(bound)),))} {cumulative}')
+                    lines.append(f'{name}_bucket{_labels(labels + (("le", "+Inf"),))} {data[-1]}')
+                    lines.append(f'{name}_sum{_labels(labels)} {data[-2]}')
+                    lines.append(f'{name}_count{_labels(labels)} {data[-1]}')
+        return '\n'.join(lines) + '\n'
+
+    def _header(self, name: str, kind: str) -> list:
+        kind, text = self._help.get(name, (kind, ''))
+        return [f'# HELP {name} {text}', f'# TYPE {name} {kind}'] if text else [f'# TYPE {name} {kind}']
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join('{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"')) for key, value in labels)
+    return '{' + pairs + '}'
+
+
+_originals = {}     # (class, 함수명) -> 원본 속성
+
+
+def _timer(registry: MetricsRegistry, func, label: tuple, is_failure):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            registry.inc('common_call_failures_total', label)
+            raise
+        finally:
+            registry.observe('common_call_duration_seconds', time.perf_counter() - start, label)
+            registry.inc('common_calls_total', label)
+        if is_failure(result):
+            registry.inc('common_call_failures_total', label)
+        return result
+    return wrapper
+
+
+def instrument(registry: MetricsRegistry, targets: dict = None) -> None:
+    """
+        INSTRUMENT_TARGETS의 함수를 호출 수, 실패 수, 지연시간을 기록하는 함수로 교체합니다.
+        Validation 검사는 검사 실패(True 리턴)를 실패로 집계합니다.
+    """
+    registry.describe('common_calls_total', 'counter', 'common 모듈 함수 호출 수')
+    registry.describe('common_call_failures_total', 'counter', 'common 모듈 함수 실패(예외 또는 검사 실패) 수')
+    registry.describe('common_call_duration_seconds', 'histogram', 'common 모듈 함수 실행 시간')
+    for cls, methods in (targets or INSTRUMENT_TARGETS).items():
+        for name, is_failure in methods.items():
+            key = (cls, name)
+            original = _originals.setdefault(key, cls.__dict__[name])
+            label = (('function', f'{cls.__name__}.{name}'),)
+            if isinstance(original, classmethod):
+                setattr(cls, name, classmethod(_timer(registry, original.__func__, label, is_failure)))
+            else:
+                setattr(cls, name, _timer(registry, original, label, is_failure))
+
+
+def uninstrument() -> None:
+    """
+        instrument로 교체한 함수를 원본으로 되돌립니다.
+    """
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+class MetricsMiddleware():
+    """
+        route별 요청 수, 지연시간 histogram을 기록하는 ASGI 미들웨어\n
+        route label은 경로 템플릿(/users/{user_no})을 사용하며, 매칭되지 않은 요청은 <unmatched>로 기록합니다.
+    """
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+        self._routes = None
+        registry.describe('http_request_duration_seconds', 'histogram', 'route별 요청 처리 시간')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status[0] = message['status']
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            labels = (('method', scope['method']), ('route', self._route(scope)), ('status', status[0]))
+            self.registry.observe('http_request_duration_seconds', time.perf_counter() - start, labels)
+
+    def _route(self, scope) -> str:
+        route = scope.get('route')
+        if route is not None:
+            return route.path
+        endpoint = scope.get('endpoint')
+        if endpoint is None:
+            return '<unmatched>'
+        if self._routes is None:
+            self._routes = {r.endpoint: r.path for r in scope['app'].routes if hasattr(r, 'endpoint')}
+        return self._routes.get(endpoint, '<unmatched>')
@@ -0,0 +1,269 @@
+"""
+Eng2Kor 기반 검색어 색인
+
+LayoutSearchIndex : 한/영 자판 상태와 관계없이 ("dkssud" -> "안녕") 접두어 검색
+ChoseongIndex     : 초성 검색 ("ㅅㄱ" -> "서강"), 추가/삭제 지원
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+import struct
+
+from common.utiltiy import Eng2Kor
+
+
+class _BlobList():
+    """
+        하나의 UTF-8 bytes와 offset 배열로 저장한 읽기 전용 bytes 리스트\n
+        항목마다 str 객체를 만들지 않아 메모리를 적게 사용하며, bisect에 그대로 사용할 수 있습니다.
+    """
+    def __init__(self, blob: bytes, offsets: array):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def from_items(cls, items: list) -> '_BlobList':
+        return cls(b''.join(items), array('Q', accumulate(map(len, items), initial=0)))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> bytes:
+        return self.blob[self.offsets[idx]:self.offsets[idx + 1]]
+
+
+class LayoutSearchIndex():
+    """
+        카탈로그 검색어 색인\n
+        검색어마다 한글 원문(소문자)과 Eng2Kor.conv_ko2en 자판 입력 형태를 하나의 정렬 배열에 저장합니다.
+        검색어도 자판 입력 형태로 바꾸어 찾으므로 한글("안녕"), 조합 중인 한글("안ㄴ"), 영문 자판 입력("dkssud", "dkss")
+        어느 쪽으로 입력해도 같은 검색어를 찾습니다.\n
+        index = LayoutSearchIndex.build(['안녕하세요', '아이폰', 'iPhone'])
+        index.search('dkssud') -> ['안녕하세요']
+    """
+    _magic = b'LSI1'
+
+    def __init__(self, terms: _BlobList, keys: _BlobList, ids: array):
+        self._terms = terms     # 검색어 원문
+        self._keys = keys       # 정렬된 색인 키
+        self._ids = ids         # 색인 키 -> 검색어 번호
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @classmethod
+    def key(cls, text: str) -> str:
+        """
+            색인 키, 한글은 자판 입력 형태로 바꾸고 Shift 조합이 아닌 대문자는 소문자로 바꿉니다. (split_en과 같은 규칙)
+        """
+        return Eng2Kor.conv_ko2en(text).translate(Eng2Kor.en2ko_tables()[0])
+
+    @classmethod
+    def build(cls, terms) -> 'LayoutSearchIndex':
+        """
+            검색어 리스트로 색인 생성, 중복된 검색어는 하나만 저장합니다.
+        """
+        terms = list(dict.fromkeys(terms))
+        entries = []
+        for idx, term in enumerate(terms):
+            key = cls.key(term)
+            entries.append((key.encode(), idx))
+            if term.lower() != key:
+                entries.append((term.lower().encode(), idx))
+        entries.sort()
+        return cls(
+            _BlobList.from_items([term.encode() for term in terms]),
+            _BlobList.from_items([key for key, _ in entries]),
+            array('I', (idx for _, idx in entries)),
+        )
+
+    def _range(self, prefix: bytes) -> range:
+        start = bisect_left(self._keys, prefix)
+        # UTF-8에는 0xff 바이트가 없으므로 prefix로 시작하는 모든 키보다 큽니다.
+        return range(start, bisect_left(self._keys, prefix + b'\xff', start))
+
+    def search(self, query: str, limit: int = 10, max_scan: int = 1000) -> list:
+        """
+            query로 시작하는 검색어 리스트\n
+            정확히 일치하는 검색어, 짧은 검색어 순으로 정렬합니다.\n
+            max_scan : 짧은 query로 범위가 큰 경우 살펴볼 최대 색인 항목 수
+        """
+        if not query:
+            return []
+        key = self.key(query)
+        prefixes = {key.encode(), query.lower().encode()}
+
+        key_offsets = self._keys.offsets
+        term_offsets = self._terms.offsets
+        found = {}
+        for prefix in prefixes:
+            size = len(prefix)
+            positions = self._range(prefix)[:max_scan]
+            for pos, idx in zip(positions, self._ids[positions.start:positions.stop]):
+                if idx not in found:
+                    # (정확히 일치하지 않음, 검색어 길이(bytes), 번호)
+                    found[idx] = (key_offsets[pos + 1] - key_offsets[pos] != size,
+                                  term_offsets[idx + 1] - term_offsets[idx], idx)
+        ranked = sorted(found.values())[:limit]
+        return [self._terms[idx].decode() for _, _, idx in ranked]
+
+    def save(self, path: str) -> None:
+        """
+            색인 파일 저장, 같은 종류의 서버에서 load로 바로 사용할 수 있는 형식입니다.
+        """
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<4sQQQQ', self._magic, len(self._terms.offsets), len(self._terms.blob),
+                                len(self._keys.offsets), len(self._keys.blob)))
+            self._terms.offsets.tofile(f)
+            f.write(self._terms.blob)
+            self._keys.offsets.tofile(f)
+            f.write(self._keys.blob)
+            self._ids.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> 'LayoutSearchIndex':
+        """
+            save로 저장한 색인 파일 로드
+        """
+        with open(path, 'rb') as f:
+            magic, term_count, term_size, key_count, key_size = struct.unpack('<4sQQQQ', f.read(36))
+            if magic != cls._magic:
+                raise ValueError('색인 파일 형식이 올바르지 않습니다.')
+            term_offsets = array('Q')
+            term_offsets.fromfile(f, term_count)
+            term_blob = f.read(term_size)
+            key_offsets = array('Q')
+            key_offsets.fromfile(f, key_count)
+            key_blob = f.read(key_size)
+            ids = array('I')
+            ids.fromfile(f, key_count - 1)
+        return cls(_BlobList(term_blob, term_offsets), _BlobList(key_blob, key_offsets), ids)
+
+
+class _ChoseongTable(dict):
+    # str.translate에서 테이블에 없는 문자는 삭제
+    def __missing__(self, key):
+        return None
+
+
+class ChoseongIndex():
+    """
+        초성 검색 색인 ("ㅅㄱ" -> "서강대학교")\n
+        검색어마다 Eng2Kor.split_ko의 top_idx 순서를 1바이트씩(top_idx + 1) 하나의 bytearray에 0으로 구분하여 저장하고,
+        bytes.find로 접두어/부분 일치를 찾습니다. 검색어 원문도 UTF-8 bytearray와 offset 배열로 저장합니다.\n
+        add는 배열 끝에 추가하고, remove는 해당 항목을 검색되지 않도록 지운 뒤 삭제된 항목이 많아지면 compact로 다시 만듭니다.\n
+        index = ChoseongIndex(['서강대학교', '서울', '강서구'])
+        index.search('ㅅㄱ') -> ['서강대학교', '강서구']
+    """
+    _table = None
+    compact_ratio = 0.25    # 삭제된 항목 비율이 넘으면 compact
+
+    def __init__(self, terms=()):
+        terms = list(terms)
+        seqs = [self.choseong(term) for term in terms]
+        encoded = [term.encode() for term in terms]
+        # 모든 항목 앞에 0이 오도록 맨 앞에 0 추가, seq_offsets[i]는 i번째 초성 순서의 시작 위치
+        self._seqs = bytearray(b'\x00' + b''.join(seq + b'\x00' for seq in seqs))
+        self._seq_offsets = array('I', accumulate((len(seq) + 1 for seq in seqs), initial=1))
+        self._terms = bytearray(b''.join(encoded))
+        self._term_offsets = array('Q', accumulate(map(len, encoded), initial=0))
+        self._alive = bytearray(b'\x01' * len(terms))
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return len(self._alive) - self._removed
+
+    @classmethod
+    def choseong(cls, text: str) -> bytes:
+        """
+            text의 초성 순서, 한글 음절과 자음(ㄱ, ㄲ, ...)만 사용하고 나머지 문자는 무시합니다.\n
+            "서강 대학교" -> ㅅㄱㄷㅎㄱ의 top_idx + 1
+        """
+        if cls._table is None:
+            table = _ChoseongTable()
+            syllables = ''.join(chr(code) for code in range(44032, 55204))
+            for code, split in zip(range(44032, 55204), Eng2Kor.split_ko(syllables)):
+                table[code] = chr(split[0] + 1)
+            for top_idx, jamo in enumerate(Eng2Kor.ko_top):
+                table[ord(jamo)] = chr(top_idx + 1)
+            cls._table = table
+        return text.translate(cls._table).encode('latin-1')
+
+    def add(self, term: str) -> int:
+        """
+            검색어 추가, 항목 번호 리턴
+        """
+        seq = self.choseong(term)
+        encoded = term.encode()
+        self._seqs += seq + b'\x00'
+        self._seq_offsets.append(len(self._seqs))
+        self._terms += encoded
+        self._term_offsets.append(len(self._terms))
+        self._alive.append(1)
+        return len(self._alive) - 1
+
+    def remove(self, term: str) -> bool:
+        """
+            검색어 삭제, 없는 검색어인 경우 False 리턴
+        """
+        encoded = term.encode()
+        offsets = self._term_offsets
+        pos = self._terms.find(encoded)
+        while pos >= 0:
+            idx = bisect_right(offsets, pos) - 1
+            if offsets[idx] == pos and offsets[idx + 1] - pos == len(encoded) and self._alive[idx]:
+                # 초성 순서를 검색어에 나오지 않는 0xff로 덮어써서 검색에서 제외
+                start, end = self._seq_offsets[idx], self._seq_offsets[idx + 1] - 1
+                self._seqs[start:end] = b'\xff' * (end - start)
+                self._alive[idx] = 0
+                self._removed += 1
+                if self._removed > len(self._alive) * self.compact_ratio:
+                    self.compact()
+                return True
+            pos = self._terms.find(encoded, pos + 1)
+        return False
+
+    def compact(self) -> None:
+        """
+            삭제된 항목을 제거하여 배열을 다시 생성, 항목 번호가 바뀝니다.
+        """
+        self.__init__(self.terms())
+
+    def term(self, idx: int) -> str:
+        return self._terms[self._term_offsets[idx]:self._term_offsets[idx + 1]].decode()
+
+    def terms(self) -> list:
+        """
+            삭제되지 않은 검색어 리스트
+        """
+        return [self.term(idx) for idx, alive in enumerate(self._alive) if alive]
+
+    def search(self, query: str, limit: int = 10, max_scan: int = 1000) -> list:
+        """
+            초성 순서가 query로 시작하거나 query를 포함하는 검색어 리스트\n
+            접두어 일치, 일치 위치가 앞인 검색어, 초성 수가 적은 검색어 순으로 정렬합니다.\n
+            부분 일치는 접두어 일치가 limit개보다 적은 경우에만 찾습니다.\n
+            max_scan : 짧은 query로 일치하는 항목이 많은 경우 살펴볼 최대 항목 수
+        """
+        seq = self.choseong(query)
+        if not seq:
+            return []
+        found = self._find(b'\x00' + seq, 1, max_scan)
+        if len(found) < limit:
+            found.update(self._find(seq, 0, max_scan, exclude=found))
+        ranked = sorted(found.values())[:limit]
+        return [self.term(idx) for _, _, idx in ranked]
+
+    def _find(self, pattern: bytes, shift: int, max_scan: int, exclude: dict = None) -> dict:
+        # 항목 번호 -> (일치 위치, 초성 수, 항목 번호)
+        blob = self._seqs
+        offsets = self._seq_offsets
+        found = {}
+        pos = blob.find(pattern)
+        while pos >= 0 and len(found) < max_scan:
+            start = pos + shift
+            idx = bisect_right(offsets, start) - 1
+            if not exclude or idx not in exclude:
+                found.setdefault(idx, (start - offsets[idx], offsets[idx + 1] - offsets[idx], idx))
+            pos = blob.find(pattern, pos + 1)
+        return found
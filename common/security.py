@@ -0,0 +1,95 @@
+"""
+JsonToken 기반 FastAPI 인증 dependency
+
+    from common.security import get_claims, auth_router
+
+    app.include_router(auth_router)     # POST /token/refresh
+
+    @app.get('/me')
+    def me(claims: dict = Depends(get_claims)):
+        ...
+
+FastAPI는 요청 안에서 같은 dependency 결과를 재사용하므로, 여러 sub-dependency가 get_claims를 사용해도
+토큰은 요청당 한번만 디코드됩니다. 결과는 request.state.claims에도 저장되어 use_cache=False인 경우나
+미들웨어에서도 다시 디코드하지 않습니다.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import jwt
+from pydantic import BaseModel
+
+from common.auth import JsonToken
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={'WWW-Authenticate': 'Bearer'},
+    )
+
+
+def _decode(token: str, category: str) -> dict:
+    try:
+        claims = JsonToken.decode_token(token, is_access=category == 'access')
+    except jwt.ExpiredSignatureError:
+        raise _unauthorized('만료된 토큰입니다.')
+    except jwt.InvalidTokenError:
+        raise _unauthorized('유효하지 않은 토큰입니다.')
+    if claims.get('category') != category:
+        raise _unauthorized('유효하지 않은 토큰입니다.')
+    return claims
+
+
+async def get_claims(request: Request, credentials: HTTPAuthorizationCredentials = Depends(bearer)) -> dict:
+    """
+        Authorization: Bearer <access token> 헤더의 토큰을 디코드하여 claims 리턴\n
+        토큰이 없거나 만료, 폐기, 위조된 경우 401
+    """
+    claims = getattr(request.state, 'claims', None)
+    if claims is not None:
+        return claims
+
+    if credentials is None:
+        raise _unauthorized('인증 토큰이 필요합니다.')
+    claims = _decode(credentials.credentials, 'access')
+    request.state.claims = claims
+    return claims
+
+
+def refresh_tokens(refresh_token: str) -> dict:
+    """
+        refresh token을 검증하고 access, refresh 토큰을 모두 새로 발급\n
+        category가 refresh인 토큰만 허용하며, 사용한 refresh token은 폐기 목록에 추가되어 다시 사용할 수 없습니다.
+        동시에 같은 토큰으로 요청한 경우 폐기 목록에 먼저 추가한 요청만 성공합니다.\n
+        폐기 목록(JsonToken.denylist)은 프로세스 메모리에 있으므로 1회 사용은 같은 워커 안에서만 보장됩니다.
+        여러 워커(WEB_WORKERS)에서는 다른 워커로 재사용한 토큰을 막지 못하므로, 필요한 경우 공유 저장소 기반의 denylist로 교체합니다.\n
+        새 토큰의 정보는 기존 토큰의 claims(JsonToken.require_parameter)를 그대로 사용하므로 DB 조회가 필요 없습니다.
+    """
+    claims = _decode(refresh_token, 'refresh')
+    if JsonToken.denylist is not None and claims.get('jti'):
+        if not JsonToken.denylist.add(claims['jti'], claims['exp']):
+            raise _unauthorized('이미 사용된 토큰입니다.')
+    return JsonToken.encode_token(claims)
+
+
+class RefreshBody(BaseModel):
+    refresh: str
+
+
+class TokenPair(BaseModel):
+    access: str
+    refresh: str
+
+
+auth_router = APIRouter(tags=['auth'])
+
+
+@auth_router.post('/token/refresh', response_model=TokenPair)
+async def refresh(body: RefreshBody) -> dict:
+    """
+        refresh token으로 access, refresh 토큰 재발급
+    """
+    return refresh_tokens(body.refresh)
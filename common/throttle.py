@@ -0,0 +1,306 @@
+"""
+로그인 시도 제한 (token bucket)
+
+    from common.throttle import check_login
+
+    @app.post('/login')
+    def login(request: Request, body: LoginBody):
+        check_login(request, body.user_id)     # 제한된 경우 429, RSA 복호화/bcrypt 검증 전에 호출
+        ...
+
+IP별, 계정별 token bucket을 따로 두고 둘 중 하나라도 비어 있으면 거부합니다.
+거부는 dict 조회와 산술 연산만 하므로 RSAUtility.decode, Bcrypt.verify 비용이 발생하지 않습니다.
+
+환경변수
+    THROTTLE_IP_RATE, THROTTLE_IP_BURST           : IP별 초당 허용 횟수, 최대 연속 허용 횟수 (기본값 1, 10)
+    THROTTLE_ACCOUNT_RATE, THROTTLE_ACCOUNT_BURST : 계정별 초당 허용 횟수, 최대 연속 허용 횟수 (기본값 0.1, 5)
+    THROTTLE_SHM                                  : 공유 메모리 이름, 설정한 경우 같은 서버의 uvicorn 워커가 bucket을 공유
+    THROTTLE_TRUSTED_PROXIES                      : 신뢰하는 리버스 프록시 IP (쉼표 구분)
+                                                    요청이 이 IP에서 온 경우 X-Forwarded-For에서 클라이언트 IP를 읽습니다.
+
+리버스 프록시(nginx, 로드밸런서) 뒤에서 THROTTLE_TRUSTED_PROXIES를 설정하지 않으면 모든 요청의 IP가 프록시 IP가 되어
+모든 사용자가 하나의 IP bucket(기본값 초당 1회, 최대 10회)을 같이 사용하므로 정상 로그인도 제한됩니다.
+"""
+from collections import OrderedDict
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from fastapi import HTTPException, Request, status
+
+
+class RateLimiter():
+    """
+        프로세스 내 token bucket\n
+        rate : 초당 채워지는 token 수, capacity : 최대 token 수(연속 허용 횟수)\n
+        bucket은 마지막 사용 순서의 OrderedDict에 저장되며, 가득 찰 만큼 시간이 지난 bucket은 상태가 없어도 같으므로 제거합니다.
+        max_keys를 넘으면 가장 오래 사용하지 않은 bucket부터 제거합니다.
+    """
+    def __init__(self, rate: float, capacity: float, max_keys: int = 100000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._idle = capacity / rate    # 빈 bucket이 가득 차는 시간
+        self._buckets = OrderedDict()   # key -> (tokens, 갱신 시간)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def hit(self, key, cost: float = 1, now: float = None) -> float:
+        """
+            key의 token을 cost만큼 사용\n
+            허용된 경우 0, 거부된 경우 다시 시도할 수 있을 때까지의 시간(초) 리턴
+        """
+        now = time.monotonic() if now is None else now
+        buckets = self._buckets
+        with self._lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                tokens = self.capacity
+            else:
+                tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                buckets.move_to_end(key)
+
+            if tokens >= cost:
+                tokens -= cost
+                wait = 0.0
+            else:
+                wait = (cost - tokens) / self.rate
+            buckets[key] = (tokens, now)
+
+            while buckets:
+                oldest = next(iter(buckets.values()))
+                if now - oldest[1] < self._idle and len(buckets) <= self.max_keys:
+                    break
+                buckets.popitem(last=False)
+        return wait
+
+    def reset(self, key) -> None:
+        """
+            key의 bucket을 가득 찬 상태로 초기화 (로그인 성공 시 계정 bucket 초기화 등)
+        """
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+class SharedRateLimiter():
+    """
+        같은 서버의 여러 프로세스가 공유하는 token bucket\n
+        multiprocessing.shared_memory에 (key hash, tokens, 갱신 시간) slot 배열을 만들고 fcntl 파일 lock으로 보호합니다.\n
+        key hash는 공유 메모리를 만들 때 생성한 임의의 salt를 키로 사용하므로, 공격자가 다른 사용자와 같은 slot 범위에
+        들어가는 key를 미리 골라 bucket을 밀어낼 수 없습니다.\n
+        key는 slots 크기의 해시 테이블에 저장되며, probe개 slot 안에서 같은 key, 빈 slot 또는 가득 찬 bucket 순으로 사용하고
+        모두 사용 중인 경우 가장 오래된 slot을 덮어씁니다.\n
+        공유 메모리는 첫 프로세스가 생성하고 이후 프로세스는 연결하며, 서버 종료 후 정리하려면 unlink를 호출합니다.
+    """
+    _slot = struct.Struct('<Qdd')
+    _header_size = 16   # 공유 메모리 앞부분의 hash salt
+
+    def __init__(self, name: str, rate: float, capacity: float, slots: int = 65536, probe: int = 8):
+        import fcntl
+        from multiprocessing import resource_tracker, shared_memory
+
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.slots = slots
+        self.probe = probe
+        self._idle = capacity / rate
+        self._fcntl = fcntl
+        self._lock = threading.Lock()   # flock은 프로세스 단위이므로 스레드 간에는 별도 lock 사용
+        self._lock_file = open(os.path.join(tempfile.gettempdir(), f'{name}.lock'), 'a+b')
+
+        size = self._header_size + self._slot.size * slots
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+                self._shm.buf[:self._header_size] = os.urandom(self._header_size)
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name=name)
+            self._salt = bytes(self._shm.buf[:self._header_size])
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        # 워커 하나가 종료될 때 resource tracker가 공유 메모리를 삭제하지 않도록 등록 해제
+        resource_tracker.unregister(self._shm._name, 'shared_memory')
+        if self._shm.size < size:
+            self.close()
+            raise ValueError(f'공유 메모리 {name}의 크기가 slots 설정보다 작습니다.')
+
+    def _hash(self, key) -> int:
+        # 프로세스마다 다른 hash() 대신 공유 메모리의 salt를 키로 사용한 해시, 0은 빈 slot
+        digest = hashlib.blake2b(str(key).encode(), digest_size=8, key=self._salt).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    def _find(self, key_hash: int, now: float) -> tuple:
+        # (slot 위치, 저장된 tokens, 갱신 시간), 새 slot인 경우 tokens는 None
+        buf = self._shm.buf
+        unpack = self._slot.unpack_from
+        start = key_hash % self.slots
+        candidate = None
+        for step in range(self.probe):
+            offset = self._header_size + (start + step) % self.slots * self._slot.size
+            stored_hash, tokens, updated = unpack(buf, offset)
+            if stored_hash == key_hash:
+                return offset, tokens, updated
+            if stored_hash == 0 or now - updated >= self._idle:
+                if candidate is None or candidate[1] != -math.inf:
+                    candidate = (offset, -math.inf)
+            elif candidate is None or updated < candidate[1]:
+                candidate = (offset, updated)
+        return candidate[0], None, now
+
+    def hit(self, key, cost: float = 1, now: float = None) -> float:
+        """
+            RateLimiter.hit과 같음
+        """
+        now = time.monotonic() if now is None else now
+        key_hash = self._hash(key)
+        with self._lock:
+            self._fcntl.flock(self._lock_file, self._fcntl.LOCK_EX)
+            try:
+                offset, tokens, updated = self._find(key_hash, now)
+                if tokens is None:
+                    tokens = self.capacity
+                else:
+                    tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+
+                if tokens >= cost:
+                    tokens -= cost
+                    wait = 0.0
+                else:
+                    wait = (cost - tokens) / self.rate
+                self._slot.pack_into(self._shm.buf, offset, key_hash, tokens, now)
+            finally:
+                self._fcntl.flock(self._lock_file, self._fcntl.LOCK_UN)
+        return wait
+
+    def reset(self, key) -> None:
+        """
+            RateLimiter.reset과 같음
+        """
+        key_hash = self._hash(key)
+        with self._lock:
+            self._fcntl.flock(self._lock_file, self._fcntl.LOCK_EX)
+            try:
+                offset, tokens, _ = self._find(key_hash, time.monotonic())
+                if tokens is not None:
+                    self._slot.pack_into(self._shm.buf, offset, 0, 0.0, 0.0)
+            finally:
+                self._fcntl.flock(self._lock_file, self._fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """
+            현재 프로세스의 공유 메모리 연결 종료
+        """
+        self._shm.close()
+        self._lock_file.close()
+
+    def unlink(self) -> None:
+        """
+            공유 메모리 삭제, 모든 워커가 종료된 후 호출합니다.
+        """
+        from multiprocessing import resource_tracker
+
+        # SharedMemory.unlink가 등록 해제를 다시 요청하므로 먼저 등록
+        resource_tracker.register(self._shm._name, 'shared_memory')
+        self._shm.unlink()
+
+
+class LoginThrottle():
+    """
+        IP별, 계정별 로그인 시도 제한\n
+        각 인자를 입력하지 않는 경우 THROTTLE_* 환경변수를 따르며, THROTTLE_SHM이 설정된 경우 SharedRateLimiter를 사용합니다.
+    """
+    def __init__(self, ip_limiter=None, account_limiter=None):
+        self._ip = ip_limiter
+        self._account = account_limiter
+
+    @staticmethod
+    def _from_env(kind: str, rate: float, burst: float):
+        rate = float(os.getenv(f'THROTTLE_{kind}_RATE', rate))
+        burst = float(os.getenv(f'THROTTLE_{kind}_BURST', burst))
+        if os.getenv('THROTTLE_SHM'):
+            return SharedRateLimiter(f'{os.getenv("THROTTLE_SHM")}_{kind.lower()}', rate, burst)
+        return RateLimiter(rate, burst)
+
+    @property
+    def ip(self):
+        # 워커 프로세스에서 처음 사용할 때 생성
+        if self._ip is None:
+            self._ip = self._from_env('IP', 1, 10)
+        return self._ip
+
+    @property
+    def account(self):
+        if self._account is None:
+            self._account = self._from_env('ACCOUNT', 0.1, 5)
+        return self._account
+
+    def check(self, ip: str, account: str = None) -> float:
+        """
+            로그인 시도 1회 기록\n
+            허용된 경우 0, 거부된 경우 다시 시도할 수 있을 때까지의 시간(초) 리턴\n
+            IP가 거부된 경우 계정 bucket은 사용하지 않습니다.
+        """
+        wait = self.ip.hit(ip)
+        if wait or account is None:
+            return wait
+        return self.account.hit(account)
+
+    def succeeded(self, account: str) -> None:
+        """
+            로그인 성공 시 계정 bucket 초기화
+        """
+        self.account.reset(account)
+
+
+# 기본 로그인 제한, THROTTLE_* 환경변수 설정을 사용
+login_throttle = LoginThrottle()
+
+
+# 신뢰하는 리버스 프록시 IP, None인 경우 처음 사용할 때 THROTTLE_TRUSTED_PROXIES 환경변수를 읽습니다. (load_dotenv 이후)
+trusted_proxies = None
+
+
+def _trusted_proxies() -> frozenset:
+    global trusted_proxies
+    if trusted_proxies is None:
+        trusted_proxies = frozenset(ip.strip() for ip in os.getenv('THROTTLE_TRUSTED_PROXIES', '').split(',') if ip.strip())
+    return trusted_proxies
+
+
+def client_ip(request: Request) -> str:
+    """
+        요청한 클라이언트 IP\n
+        직접 연결한 IP가 trusted_proxies인 경우에만 X-Forwarded-For를 오른쪽부터 읽어 신뢰하지 않는 첫 IP를 사용합니다.
+        (클라이언트가 보낸 X-Forwarded-For 앞부분은 위조할 수 있으므로 사용하지 않음)
+    """
+    trusted = _trusted_proxies()
+    ip = request.client.host if request.client else ''
+    if ip not in trusted:
+        return ip
+    forwarded = [part.strip() for part in request.headers.get('x-forwarded-for', '').split(',') if part.strip()]
+    for hop in reversed(forwarded):
+        if hop not in trusted:
+            return hop
+    return forwarded[0] if forwarded else ip
+
+
+def check_login(request: Request, account: str = None) -> None:
+    """
+        요청 IP(client_ip)와 계정으로 login_throttle을 확인하여 제한된 경우 429 (Retry-After 헤더 포함)
+    """
+    ip = client_ip(request)
+    wait = login_throttle.check(ip, account)
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail='로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.',
+            headers={'Retry-After': str(math.ceil(wait))},
+        )
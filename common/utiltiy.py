@@ -1,3 +1,6 @@
+from collections import namedtuple
+
+
 class Eng2Kor():
     ko_top = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]  # 18
     ko_mid = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ", "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ"]  # 21
@@ -11,6 +14,10 @@ class Eng2Kor():
     # raw_mapper starts on (hex)12593
     raw_mapper = ["r", "R", "rt", "s", "sw", "sg", "e", "E", "f", "fr", "fa", "fq", "ft", "fx", "fv", "fg", "a", "q", "Q", "qt", "t", "T", "d", "w", "W", "c", "z", "x", "v", "g", "k", "o", "i", "O", "j", "p", "u", "P", "h", "hk", "ho", "hl", "y", "n", "nj", "np", "nl", "b", "m", "ml", "l"]
 
+    _ko2en_table = None  # built by ko2en_table()
+    _en2ko_tables = None  # built by en2ko_tables()
+    _ko2en_arrays = None  # built by ko2en_arrays()
+
     T = 0xb_0001_0000
     M = 0xb_0000_0100
     B = 0xb_0000_0001
@@ -172,56 +179,168 @@ class Eng2Kor():
         """
         conv_en2ko(string)
         Convert English characters to Korean characters.
+        Single pass over the string; each step reads one Korean character with scan_en.
         :return: String (Korean)
         """
-        char_groups = cls.split_en(string)
-        converted_string = ''
-        for char_group in char_groups:
-            top_idx = 0
-            mid_idx = 0
-            bot_idx = 0
-            for char_capsule in enumerate(char_group):
-                if char_capsule[1] == " " or char_capsule[1].isdigit() or (not char_capsule[1].encode().isalpha()):
-                    converted_string += char_capsule[1]
-                    break
-                if len(char_group) == 1:
-                    converted_string += chr(cls.raw_mapper.index(char_capsule[1]) + 12593)
-                    break
-                if char_capsule[0] == 0:
-                    top_idx = cls.ko_top_en.index(char_capsule[1])
-                elif char_capsule[0] == 1:
-                    mid_idx = cls.ko_mid_en.index(char_capsule[1])
-                elif char_capsule[0] == 2:
-                    bot_idx = cls.ko_bot_en.index(char_capsule[1])
+        tables = cls._en2ko_tables or cls.en2ko_tables()
+        string = string.translate(tables[0])
+        length = len(string)
+        converted = []
+        idx = 0
+        while idx < length:
+            idx, char = cls.scan_en(string, idx, length, tables)
+            converted.append(char)
+        return ''.join(converted)
 
-            else:
-                converted_string += chr((top_idx * 21 * 28 + mid_idx * 28 + bot_idx) + 44032)
-        return converted_string
+    @classmethod
+    def scan_en(cls, string, idx, length, tables):
+        """
+        scan_en(string, idx, length, tables)
+        Read one Korean character group starting at string[idx].
+        The string must already be translated with tables[0] (see en2ko_tables).
+        The automaton is top -> mid (-> mid) (-> bot (-> bot)), and a final consonant is
+        handed over to the next character when a vowel follows it, the same rule split_en applies.
+        Anything that does not start a syllable is a single jamo (English letter) or is kept as it is.
+        :return: (index after the group, converted character)
+        """
+        _, top, mid, bot, single = tables
+        char = string[idx]
+        if char not in top or idx + 1 >= length or string[idx + 1] not in mid:
+            return idx + 1, single.get(char, char)
+
+        end = idx + 2
+        if end < length and string[idx + 1:end + 1] in mid:  # 모 + 모
+            end += 1
+        code = (top[char] * 21 + mid[string[idx + 1:end]]) * 28 + 44032
+
+        if end < length and string[end] in bot:  # 모 + 자
+            if end + 1 == length:
+                return end + 1, chr(code + bot[string[end]])
+            if string[end + 1] in mid:  # 자 + 모 (다음)
+                return end, chr(code)
+            double = string[end:end + 2]
+            if double in bot:  # 자 + 자 (종)
+                if end + 2 < length and string[end + 1] in top and string[end + 2] in mid:  # 자 + 자 + 모
+                    return end + 1, chr(code + bot[string[end]])
+                return end + 2, chr(code + bot[double])
+            return end + 1, chr(code + bot[string[end]])
+        return end, chr(code)
+
+    @classmethod
+    def en2ko_tables(cls):
+        """
+        en2ko_tables()
+        Build (once) the lookup tables used by conv_en2ko.
+        :return: (lowercase translate table, {top: idx}, {mid: idx}, {bot: idx}, {single key: jamo})
+        """
+        if cls._en2ko_tables is None:
+            cls._en2ko_tables = (
+                str.maketrans({c: c.lower() for c in cls.en_lower_only}),
+                {en: idx for idx, en in enumerate(cls.ko_top_en)},
+                {en: idx for idx, en in enumerate(cls.ko_mid_en)},
+                {en: idx for idx, en in enumerate(cls.ko_bot_en) if en},
+                {en: chr(idx + 12593) for idx, en in enumerate(cls.raw_mapper) if len(en) == 1},
+            )
+        return cls._en2ko_tables
 
     @classmethod
     def conv_ko2en(cls, string):
         """
         conv_ko2en(string)
         Convert Korean characters to English characters.
+        Runs a single str.translate pass over the table built by ko2en_table.
         :return: String (English)
         """
-        idx_groups = cls.split_ko(string)
-        converted_string = ''
-        for idx_group in idx_groups:
-            for idx_capsule in enumerate(idx_group):
-                if idx_capsule[1] == " " or type(idx_capsule[1]) is not int:
-                    converted_string += idx_capsule[1]
-                    continue
-                elif 12593 <= idx_capsule[1] <= 12643:
-                    converted_string += cls.raw_mapper[idx_capsule[1] - 12593]
-                    continue
-                if idx_capsule[0] == 0:
-                    converted_string += cls.ko_top_en[idx_capsule[1]]
-                elif idx_capsule[0] == 1:
-                    converted_string += cls.ko_mid_en[idx_capsule[1]]
-                elif idx_capsule[0] == 2:
-                    converted_string += cls.ko_bot_en[idx_capsule[1]]
-        return converted_string
+        return string.translate(cls._ko2en_table or cls.ko2en_table())
+
+    @classmethod
+    def ko2en_table(cls):
+        """
+        ko2en_table()
+        Build (once) the translation table used by conv_ko2en.
+        Maps every Hangul syllable (U+AC00..U+D7A3) and compatibility jamo (U+3131..U+3163)
+        to its key sequence on the QWERTY keyboard. Other characters are not in the table and stay as they are.
+        :return: dict {code point: English keys}
+        """
+        if cls._ko2en_table is None:
+            table = {}
+            for hex_zeropoint in range(11172):
+                table[hex_zeropoint + 44032] = (cls.ko_top_en[hex_zeropoint // 28 // 21]
+                                                + cls.ko_mid_en[hex_zeropoint // 28 % 21]
+                                                + cls.ko_bot_en[hex_zeropoint % 28])
+            for idx, keys in enumerate(cls.raw_mapper):
+                table[idx + 12593] = keys
+            cls._ko2en_table = table
+        return cls._ko2en_table
+
+    @classmethod
+    def ko2en_arrays(cls):
+        """
+        ko2en_arrays()
+        Build (once) the array form of ko2en_table for conv_ko2en_bulk.
+        Row (code point - 12593) holds up to 5 key code points, padded with 0.
+        :return: (keys: uint32[n, 5], lengths: uint8[n])
+        """
+        if cls._ko2en_arrays is None:
+            import numpy as np  # 검색어 변환(conv_ko2en)만 사용하는 경우 import 시간을 줄이기 위해 필요할 때 import
+
+            size = 55204 - 12593
+            keys = np.zeros((size, 5), dtype=np.uint32)
+            lengths = np.ones(size, dtype=np.uint8)
+            keys[:, 0] = np.arange(12593, 55204, dtype=np.uint32)
+            for code, en in cls.ko2en_table().items():
+                keys[code - 12593, :len(en)] = [ord(c) for c in en]
+                lengths[code - 12593] = len(en)
+            cls._ko2en_arrays = (keys, lengths)
+        return cls._ko2en_arrays
+
+    @classmethod
+    def conv_ko2en_bulk(cls, values, chunk_size=100000):
+        """
+        conv_ko2en_bulk(values, chunk_size=100000)
+        Vectorized conv_ko2en over a list, NumPy array or pandas Series.
+        Each chunk of rows is joined into one UTF-32 code point array, mapped through ko2en_arrays
+        and split back per row, so memory stays bounded by chunk_size.
+        Non-string values (None, NaN) are returned as they are.
+        :return: pandas Series (keeps the index of a Series input)
+        """
+        import pandas as pd
+
+        series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+        keys, lengths = cls.ko2en_arrays()
+        converted = []
+        for start in range(0, len(series), chunk_size):
+            converted.extend(cls._conv_ko2en_chunk(series.iloc[start:start + chunk_size].tolist(), keys, lengths))
+        return pd.Series(converted, index=series.index, dtype=object, name=series.name)
+
+    @classmethod
+    def _conv_ko2en_chunk(cls, rows, keys, lengths):
+        strings = [row for row in rows if type(row) is str]
+        if not strings:
+            return rows
+
+        import numpy as np
+
+        joined = ''.join(strings)
+        codes = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        in_table = (codes >= 12593) & (codes < 55204)
+        idx = np.where(in_table, codes - 12593, 0)
+
+        char_keys = keys[idx]
+        char_lengths = np.where(in_table, lengths[idx], 1)
+        char_keys[:, 0] = np.where(in_table, char_keys[:, 0], codes)
+        flat = char_keys[np.arange(5) < char_lengths[:, None]]
+        converted = flat.tobytes().decode('utf-32-le', 'surrogatepass')
+
+        # 입력 문자열 경계 -> 변환 문자열 경계
+        offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(char_lengths, out=offsets[1:])
+        bounds = offsets[np.concatenate(([0], np.cumsum([len(row) for row in strings])))].tolist()
+        pieces = [converted[begin:end] for begin, end in zip(bounds, bounds[1:])]
+        if len(pieces) == len(rows):
+            return pieces
+        it = iter(pieces)
+        return [next(it) if type(row) is str else row for row in rows]
 
     @classmethod
     def print_bits(cls, bit_groups):
@@ -232,3 +351,81 @@ class Eng2Kor():
         for bit_group in bit_groups:
             for bit in bit_group:
                 print(bit, end='')
+
+
+ComposerDelta = namedtuple('ComposerDelta', ['retract', 'committed', 'pending'])
+
+
+class Eng2KorComposer():
+    """
+    Eng2KorComposer()
+    Keystroke-level English -> Korean composer that agrees with Eng2Kor.conv_en2ko.
+    Only the last few keys (the syllable being composed and its lookahead) are kept pending,
+    so every keystroke costs O(1) regardless of how long the buffer is.
+    feed() returns a ComposerDelta:
+        retract   - number of previously committed characters to delete (only after backspace)
+        committed - characters that became final with this key
+        pending   - the converted pending part, replacing the previous pending text
+    """
+    BACKSPACE = '\b'
+    # A group decision reads at most 6 keys from its start (top, mid, mid, bot, bot, next vowel)
+    window = 6
+
+    def __init__(self):
+        self._tables = Eng2Kor.en2ko_tables()
+        self._pending = ''
+        self._history = []  # committed groups as (keys, character)
+
+    def feed(self, key):
+        """
+        feed(key)
+        Feed one key. Use Eng2KorComposer.BACKSPACE to delete the last key.
+        :return: ComposerDelta
+        """
+        retract = 0
+        if key == self.BACKSPACE:
+            # Committed groups whose lookahead reaches the deleted key have to be decided again
+            while len(self._pending) < self.window and self._history:
+                keys, _ = self._history.pop()
+                self._pending = keys + self._pending
+                retract += 1
+            self._pending = self._pending[:-1]
+        else:
+            self._pending += key.translate(self._tables[0])
+
+        committed = []
+        while len(self._pending) >= self.window:
+            end, char = Eng2Kor.scan_en(self._pending, 0, len(self._pending), self._tables)
+            self._history.append((self._pending[:end], char))
+            committed.append(char)
+            self._pending = self._pending[end:]
+        return ComposerDelta(retract, ''.join(committed), self.pending)
+
+    @property
+    def pending(self):
+        """
+        Converted text of the keys that are not committed yet.
+        """
+        keys = self._pending
+        length = len(keys)
+        converted = []
+        idx = 0
+        while idx < length:
+            idx, char = Eng2Kor.scan_en(keys, idx, length, self._tables)
+            converted.append(char)
+        return ''.join(converted)
+
+    @property
+    def text(self):
+        """
+        Whole converted text, same as Eng2Kor.conv_en2ko over every key fed so far.
+        """
+        return ''.join(char for _, char in self._history) + self.pending
+
+    def reset(self):
+        """
+        reset()
+        Clear the buffer.
+        """
+        self._pending = ''
+        self._history = []
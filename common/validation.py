@@ -1,4 +1,98 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Annotated
 import re
+import threading
+
+from pydantic import AfterValidator, Field, StringConstraints
+
+if TYPE_CHECKING:
+    # numpy, pandas는 DataFrame 검사에서만 사용하므로 필요할 때 import 합니다.
+    import numpy as np
+    import pandas as pd
+
+
+# 기본 유효성 검사 정규식
+INT_REX = re.compile(r'\d+$')
+DATE_REX = re.compile(r'((\d{4})|\d{2})?(-|/|.)?(?P<month>[1-9]|0[1-9]|1[0-2])(-|/|.|월 )(?P<date>([1-9]|0[1-9]|[1-2][0-9]|3[01]))일?$')
+EMAIL_REX = re.compile(r'^[a-zA-Z0-9+-_.]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+PASSWD_REX = re.compile(r'(?=.*\d{1,50})(?=.*[~`!@#$%\^&*()-+=]{1,50})(?=.*[a-zA-Z]{2,50}).{8,50}$')
+PASSWD_REPEAT_REX = re.compile('(([a-zA-Z0-9])\\2{2,})')
+
+
+# 정규식 컴파일 캐시
+class PatternRegistry():
+    """
+        정규식 패턴 문자열별로 한번만 컴파일하는 캐시\n
+        max_size를 넘으면 가장 오래 사용하지 않은 패턴부터 제거합니다.\n
+        register로 등록한 이름 있는 패턴은 제거되지 않습니다.
+    """
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._patterns = OrderedDict()
+        self._named = {}
+        self._lock = threading.Lock()
+
+    def compile(self, pattern) -> re.Pattern:
+        """
+            컴파일된 정규식 리턴\n
+            pattern : 정규식 문자열 또는 컴파일된 정규식
+        """
+        if isinstance(pattern, re.Pattern):
+            return pattern
+
+        with self._lock:
+            compiled = self._patterns.get(pattern)
+            if compiled is not None:
+                self.hits += 1
+                self._patterns.move_to_end(pattern)
+                return compiled
+            self.misses += 1
+
+        compiled = re.compile(pattern)
+        with self._lock:
+            self._patterns[pattern] = compiled
+            while len(self._patterns) > self.max_size:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def register(self, name: str, pattern) -> re.Pattern:
+        """
+            이름 있는 패턴 등록, 서버 시작 시 사용할 패턴을 미리 컴파일합니다.\n
+            name : 패턴 이름\n
+            pattern : 정규식 문자열 또는 컴파일된 정규식
+        """
+        compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+        self._named[name] = compiled
+        return compiled
+
+    def get(self, name: str) -> re.Pattern:
+        """
+            등록된 패턴 리턴, 등록되지 않은 이름인 경우 KeyError 발생
+        """
+        return self._named[name]
+
+    def stats(self) -> dict:
+        """
+            캐시 현황
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._patterns),
+            'max_size': self.max_size,
+            'named': len(self._named),
+        }
+
+    def clear(self) -> None:
+        """
+            캐시된 패턴과 통계 초기화, 등록된 패턴은 유지합니다.
+        """
+        with self._lock:
+            self._patterns.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 # 자주 사용하는 유효성 검사
@@ -8,6 +102,9 @@ class Validation():
         유효성 검사에 실패하면 True,
         유효성 검사에 성공하면 False를 리턴합니다.
     """
+    patterns = PatternRegistry()    # checkRex, checkNamed에서 사용하는 정규식 캐시
+    _int_unit_rex = {}              # checkInt 자리수별 정규식
+
     # 숫자형 체크
     @classmethod
     def checkInt(cls, data, _unit=None) -> bool:
@@ -19,9 +116,14 @@ class Validation():
         if not data:
             return False
 
-        _rex = r'\d+$' if not _unit else fr'\d{{{_unit}}}$'
+        if not _unit:
+            _rex = INT_REX
+        else:
+            _rex = cls._int_unit_rex.get(_unit)
+            if _rex is None:
+                _rex = cls._int_unit_rex[_unit] = re.compile(fr'\d{{{_unit}}}$')
 
-        if re.match(_rex, str(data)):
+        if _rex.match(str(data)):
             return False
         return True
 
@@ -31,12 +133,27 @@ class Validation():
         """
             입력된 data가 특정 정규식에 해당되는지 체크\n
             data : 검사 항목\n
-            _rex : 정규식
+            _rex : 정규식 문자열 또는 컴파일된 정규식, 문자열은 patterns에 캐시됩니다.
+        """
+        if not data:
+            return False
+
+        if cls.patterns.compile(_rex).match(str(data)):
+            return False
+        return True
+
+    # 등록된 정규식 체크
+    @classmethod
+    def checkNamed(cls, data: str, name: str) -> bool:
+        """
+            입력된 data가 patterns.register로 등록한 정규식에 해당되는지 체크\n
+            data : 검사 항목\n
+            name : 등록한 패턴 이름
         """
         if not data:
             return False
 
-        if re.match(_rex, str(data)):
+        if cls.patterns.get(name).match(str(data)):
             return False
         return True
 
@@ -83,8 +200,7 @@ class Validation():
         if not data:
             return False
 
-        _rex = r'((\d{4})|\d{2})?(-|/|.)?(?P<month>[1-9]|0[1-9]|1[0-2])(-|/|.|월 )(?P<date>([1-9]|0[1-9]|[1-2][0-9]|3[01]))일?$'
-        _res = re.match(_rex, data)
+        _res = DATE_REX.match(data)
         if _res and ((1 if (int(_res.group('date')) <= 28) else 0) if int(_res.group('month')) == 2 else 1):
             return False
         return True
@@ -98,8 +214,7 @@ class Validation():
         if not data:
             return False
 
-        _rex = r'^[a-zA-Z0-9+-_.]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-        if re.match(_rex, str(data)):
+        if EMAIL_REX.match(str(data)):
             return False
         return True
 
@@ -113,11 +228,9 @@ class Validation():
         if not data:
             return False
 
-        _rex = r'(?=.*\d{1,50})(?=.*[~`!@#$%\^&*()-+=]{1,50})(?=.*[a-zA-Z]{2,50}).{8,50}$'
         data = str(data)
-        if re.match(_rex, data):
-            _rex = '(([a-zA-Z0-9])\\2{2,})'
-            if re.search(_rex, data):
+        if PASSWD_REX.match(data):
+            if PASSWD_REPEAT_REX.search(data):
                 return True
             return False
 
@@ -180,3 +293,246 @@ class Validation():
             return True
 
         return False
+
+    # 규칙 스키마 컴파일
+    @classmethod
+    def compileSchema(cls, rules: dict) -> 'ValidationSchema':
+        """
+            필드별 규칙을 ValidationSchema로 컴파일합니다.
+            rules 형식은 ValidationSchema를 참고
+        """
+        return ValidationSchema(rules)
+
+    # DataFrame 일괄 검사
+    @classmethod
+    def checkFrame(cls, df: 'pd.DataFrame', rules: dict) -> tuple:
+        """
+            DataFrame의 컬럼별 규칙을 한번에 검사합니다.
+            rules 형식은 ValidationSchema를 참고, 결과는 ValidationSchema.validate_frame을 참고
+        """
+        return ValidationSchema(rules).validate_frame(df)
+
+
+def _rex_rule(_rex: re.Pattern):
+    def check(data) -> bool:
+        return _rex.match(str(data)) is None
+    return check
+
+
+def _list_rule(_list: list):
+    others = tuple(_list)
+    try:
+        allowed = frozenset(others)
+    except TypeError:
+        allowed = others
+
+    def check(data) -> bool:
+        try:
+            return data not in allowed
+        except TypeError:
+            return data not in others
+    return check
+
+
+def _list_values_rule(keys: list):
+    allowed = frozenset(keys)
+
+    def check(data) -> bool:
+        return type(data) != list or not allowed.issuperset(data)
+    return check
+
+
+def _int_rule(_unit):
+    # checkInt와 같이 자리수가 없는 경우(True, None, 0 등) 숫자 여부만 검사
+    return _rex_rule(INT_REX if _unit is True or not _unit else re.compile(fr'\d{{{_unit}}}$'))
+
+
+# 규칙 이름 -> 검사 함수 생성기, 검사 함수는 실패 시 True 리턴
+SCHEMA_RULES = {
+    'int': _int_rule,
+    'rex': lambda _rex: _rex_rule(Validation.patterns.compile(_rex)),
+    'named': lambda name: _rex_rule(Validation.patterns.get(name)),
+    'list': _list_rule,
+    'list_values': _list_values_rule,
+    'date': lambda _: lambda data: Validation.checkDateFormat(str(data)),
+    'email': lambda _: _rex_rule(EMAIL_REX),
+    'passwd': lambda _: Validation.checkPasswd,
+}
+
+
+# DataFrame 검사 시 str(data)로 검사하는 규칙, 중복을 제거한 값에 한번씩만 적용합니다.
+TEXT_RULES = frozenset(['int', 'rex', 'named', 'date', 'email', 'passwd'])
+
+
+def _frame_text_rule(check, codes: 'np.ndarray', uniques: 'np.ndarray') -> 'np.ndarray':
+    import numpy as np
+
+    return np.fromiter(map(check, uniques), dtype=bool, count=len(uniques))[codes]
+
+
+def _frame_value_rule(name: str, option, check, values: 'np.ndarray') -> 'np.ndarray':
+    import numpy as np
+    import pandas as pd
+
+    if name == 'list':
+        try:
+            return ~pd.Series(values).isin(option).to_numpy(dtype=bool)
+        except TypeError:
+            pass
+    return np.fromiter(map(check, values), dtype=bool, count=len(values))
+
+
+# 선언형 유효성 검사
+class ValidationSchema():
+    r"""
+        필드별 규칙을 한번 선언하고 하나의 검사 함수로 컴파일하여 사용합니다.
+        정규식, 리스트 조건은 컴파일 시 미리 준비되며 검사는 data를 한번만 순회하여 모든 오류를 리턴합니다.
+        예)
+        schema = ValidationSchema({
+            'user_no': {'require': True, 'int': 3},     # 필수 + 세자리 숫자
+            'email': {'require': True, 'email': True},
+            'use_yn': {'list': ['Y', 'N']},
+            'category': {'list_values': ['물품', '용역', '공사']},
+            'start_date': {'date': True},
+            'passwd': {'passwd': True},
+            'phone': {'rex': r'01\d-\d{3,4}-\d{4}$'},   # 또는 'named': 'phone'
+        })
+        schema.validate({'user_no': '12', 'use_yn': 'Y'})
+        -> [('user_no', 'int'), ('email', 'require')]
+        모든 검사를 통과하면 빈 리스트를 리턴합니다.
+        각 규칙은 Validation의 같은 검사와 결과가 같으며, 빈 값은 require 외의 검사를 통과합니다.
+        validate_frame은 같은 규칙으로 DataFrame을 컬럼 단위로 검사합니다.
+    """
+    def __init__(self, rules: dict):
+        self.rules = rules
+        self._fields = []
+        for field, rule in rules.items():
+            checks = []
+            for name, option in rule.items():
+                if name == 'require':
+                    continue
+                if name not in SCHEMA_RULES:
+                    raise ValueError(f'알 수 없는 규칙입니다. ({field}: {name})')
+                checks.append((name, SCHEMA_RULES[name](option)))
+            self._fields.append((field, bool(rule.get('require')), tuple(checks)))
+        self._fields = tuple(self._fields)
+
+    def validate(self, data: dict) -> list:
+        """
+            data 검사 후 실패한 (필드, 규칙) 리스트 리턴
+        """
+        errors = []
+        get = data.get
+        for field, required, checks in self._fields:
+            value = get(field)
+            if not value:
+                if required:
+                    errors.append((field, 'require'))
+                continue
+            for name, check in checks:
+                if check(value):
+                    errors.append((field, name))
+        return errors
+
+    __call__ = validate
+
+    def validate_frame(self, df: 'pd.DataFrame') -> tuple:
+        """
+            DataFrame을 컬럼 단위로 검사합니다. 규칙의 필드명은 컬럼명으로 사용합니다.
+            빈 값은 컬럼 전체를 한번에 판단하고, 정규식 규칙은 컬럼의 중복을 제거한 값에만 적용한 뒤 행으로 펼칩니다.
+            셀 단위 Validation 검사와 결과가 같으며, NaN, None, pd.NA인 셀은 빈 값으로 판단합니다.
+            값은 str(값)으로 검사하므로 업로드 파일은 pd.read_csv(path, dtype=str)처럼 문자열로 읽어야 합니다.
+            (기본 read_csv는 빈 셀이 있는 숫자 컬럼을 float로 읽어 123이 '123.0'으로 검사됩니다.)
+            리턴 : (mask, report)
+            mask : 규칙 필드별 실패 여부 boolean DataFrame (index는 df와 같음)
+            report : 실패 목록 DataFrame, 컬럼은 row(df index), column, rule
+        """
+        import numpy as np
+        import pandas as pd
+
+        mask = {}
+        failures = []
+        for field, required, checks in self._fields:
+            if field in df:
+                values = df[field].to_numpy(dtype=object)
+            else:
+                values = np.full(len(df), None, dtype=object)
+            # NaN, None, pd.NA(빈 CSV 셀)과 빈 값은 빈 값으로 판단, pd.NA는 bool 변환이 불가능하므로 먼저 제외
+            empty = pd.isna(values)
+            filled = ~empty
+            empty[filled] = ~values[filled].astype(bool)
+            failed = empty.copy() if required else np.zeros(len(df), dtype=bool)
+            if required:
+                failures.append((np.flatnonzero(empty), field, 'require'))
+
+            codes = None
+            for name, check in checks:
+                if empty.all():
+                    break
+                if name in TEXT_RULES:
+                    if codes is None:
+                        codes, uniques = pd.factorize(np.array(list(map(str, values)), dtype=object))
+                    rule_failed = _frame_text_rule(check, codes, uniques)
+                else:
+                    rule_failed = _frame_value_rule(name, self.rules[field][name], check, values)
+                rule_failed &= ~empty
+                failures.append((np.flatnonzero(rule_failed), field, name))
+                failed |= rule_failed
+            mask[field] = failed
+
+        mask = pd.DataFrame(mask, index=df.index)
+        positions = np.concatenate([pos for pos, _, _ in failures] + [np.zeros(0, dtype=np.int64)])
+        order = np.argsort(positions, kind='stable')
+        sizes = [len(pos) for pos, _, _ in failures]
+        report = pd.DataFrame({
+            'row': df.index[positions[order]],
+            'column': np.repeat([field for _, field, _ in failures], sizes)[order],
+            'rule': np.repeat([name for _, _, name in failures], sizes)[order],
+        })
+        return mask, report
+
+
+# pydantic 타입
+# Validation 규칙을 pydantic 필드 타입으로 사용합니다. 정규식과 길이 조건은 pydantic-core에서 검사되며
+# OpenAPI 스키마에 표시됩니다. pydantic-core 정규식이 지원하지 않는 조건(2월 날짜, 비밀번호 lookahead)만
+# AfterValidator에서 Validation으로 검사합니다.
+# Validation과 달리 빈 문자열은 실패합니다. (requireCheck + 검사) 선택 항목은 Optional로 선언합니다.
+# pydantic-core 정규식의 $는 문자열 끝에서만 일치하므로 끝에 줄바꿈이 있는 값도 실패합니다.
+# Validation의 re.match는 $가 끝의 줄바꿈 하나 앞에서도 일치하여 '12\n', 'a@b.com\n'을 통과시키지만,
+# 이 타입들(Digits, Email, DateFormat, digits, regex)은 실패시킵니다.
+def _after(check, message: str):
+    def validate(data: str) -> str:
+        if check(data):
+            raise ValueError(message)
+        return data
+    return AfterValidator(validate)
+
+
+Digits = Annotated[str, StringConstraints(pattern=r'^\d+$')]
+Email = Annotated[str, StringConstraints(pattern=EMAIL_REX.pattern)]
+DateFormat = Annotated[
+    str,
+    StringConstraints(pattern=f'^{DATE_REX.pattern}'),
+    _after(Validation.checkDateFormat, '존재하지 않는 날짜입니다.'),
+]
+Password = Annotated[
+    str,
+    StringConstraints(min_length=8, max_length=50),
+    Field(description='영어, 특수문자, 숫자 포함 8~50글자, 같은 문자 3회 이상 반복 불가'),
+    _after(Validation.checkPasswd, '비밀번호 형식이 올바르지 않습니다.'),
+]
+
+
+def digits(_unit: int):
+    """
+        _unit 자리 숫자 문자열 타입, Validation.checkInt(data, _unit)과 같습니다. (끝의 줄바꿈은 실패)
+    """
+    return Annotated[str, StringConstraints(pattern=fr'^\d{{{_unit}}}$')]
+
+
+def regex(_rex: str):
+    """
+        정규식 문자열 타입, Validation.checkRex와 같이 문자열 처음부터 검사합니다.\n
+        _rex가 $로 끝나는 경우 checkRex는 끝의 줄바꿈 하나를 허용하지만 이 타입은 허용하지 않습니다.
+    """
+    return Annotated[str, StringConstraints(pattern=_rex if _rex.startswith('^') else f'^(?:{_rex})')]
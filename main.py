@@ -1,7 +1,160 @@
+"""
+FastAPI 앱 생성 및 실행
+
+    python main.py                  # WEB_WORKERS 개수만큼 uvicorn 워커 실행
+    uvicorn main:app                # 단일 프로세스 실행
+
+환경변수 또는 .env 설정
+    WEB_HOST, WEB_PORT, WEB_WORKERS : uvicorn 실행 설정 (기본값 0.0.0.0, 8000, CPU 개수)
+    FAST_JSON                       : 1인 경우 ORJSONResponse를 기본 응답으로 사용 (orjson 설치 필요)
+    RSA_PRIVATE_PATH, RSA_PUBLIC_PATH : 시작 시 미리 로드할 RSA 키 경로
+    JWT_KEY, JWT_REFRESH_KEY        : JsonToken 키
+    JWT_CLAIMS_CACHE_SIZE           : JsonToken 검증 토큰 캐시 크기
+    TOKEN_DENYLIST_PATH             : 토큰 폐기 목록 파일, 시작 시 로드하고 종료 시 저장
+                                      폐기 목록은 워커 프로세스마다 따로 관리되며 실행 중에는 공유되지 않습니다.
+                                      WEB_WORKERS > 1인 경우 로그아웃한 access token이 다른 워커에서는 만료 전까지 유효합니다.
+    BCRYPT_ROUNDS                   : 새 비밀번호 해시의 cost (기본값 12)
+    BCRYPT_TARGET_MS                : BCRYPT_ROUNDS가 없는 경우 해시 1회가 이 시간(ms) 이하인 cost로 calibrate
+                                      python main.py는 워커 실행 전 부모 프로세스에서 한번 측정하여 BCRYPT_ROUNDS로 전달합니다.
+                                      uvicorn --workers로 여러 워커를 실행하는 경우 워커마다 결과가 달라지므로 BCRYPT_ROUNDS를 지정합니다.
+    THROTTLE_*                      : 로그인 시도 제한 설정 (common/throttle.py 참고)
+    METRICS                         : 1인 경우 route/common 모듈 지표를 수집하여 /metrics로 제공
+"""
+from contextlib import asynccontextmanager
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
+import uvicorn
+
+from common.auth import Bcrypt, JsonToken, RSAUtility
+from common.metrics import MetricsMiddleware, MetricsRegistry, instrument
+from common.utiltiy import Eng2Kor
+
+load_dotenv()
+logger = logging.getLogger('uvicorn.error')
+
+
+def _timed(report: dict, name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    report[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def _load_settings() -> None:
+    JsonToken.JWT_KEY = os.getenv('JWT_KEY', JsonToken.JWT_KEY)
+    JsonToken.JWT_REFRESH_KEY = os.getenv('JWT_REFRESH_KEY', JsonToken.JWT_REFRESH_KEY)
+    JsonToken.claims_cache_size = int(os.getenv('JWT_CLAIMS_CACHE_SIZE', JsonToken.claims_cache_size))
+
+
+def _calibrate_bcrypt() -> None:
+    # 모든 워커가 같은 cost를 사용하도록 부모 프로세스에서 한번만 측정하여 환경변수로 전달
+    if not os.getenv('BCRYPT_ROUNDS') and os.getenv('BCRYPT_TARGET_MS'):
+        os.environ['BCRYPT_ROUNDS'] = str(Bcrypt.calibrate(float(os.getenv('BCRYPT_TARGET_MS'))))
+        logger.info('bcrypt rounds calibrated to %s', Bcrypt.rounds)
+
+
+def _load_bcrypt() -> None:
+    if os.getenv('BCRYPT_ROUNDS'):
+        Bcrypt.rounds = int(os.getenv('BCRYPT_ROUNDS'))
+    elif os.getenv('BCRYPT_TARGET_MS'):
+        # uvicorn main:app 단일 프로세스 실행
+        _calibrate_bcrypt()
+
+
+def _load_rsa_keys() -> None:
+    rsa = RSAUtility(os.getenv('RSA_PRIVATE_PATH'), os.getenv('RSA_PUBLIC_PATH'))
+    rsa.reload_keys(force=True)
+
+
+def _load_denylist() -> None:
+    if os.getenv('TOKEN_DENYLIST_PATH') and JsonToken.denylist is not None:
+        JsonToken.denylist.load(os.getenv('TOKEN_DENYLIST_PATH'))
+
+
+def _warm_tables() -> None:
+    Eng2Kor.ko2en_table()
+    Eng2Kor.en2ko_tables()
+    Eng2Kor.ko2en_arrays()
+
+
+def _warm_token() -> None:
+    if JsonToken.JWT_KEY and JsonToken.JWT_REFRESH_KEY:
+        token = JsonToken.encode_token({key: '' for key in JsonToken.require_parameter})
+        JsonToken.decode_token(token['access'])
+        JsonToken.decode_token(token['refresh'], False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+        트래픽을 받기 전에 설정, 키, 변환 테이블을 미리 로드합니다.
+        단계별 소요 시간(ms)은 app.state.startup_report에 저장되고 로그로 출력됩니다.
+    """
+    report = {}
+    start = time.perf_counter()
+    _timed(report, 'settings', _load_settings)
+    _timed(report, 'bcrypt', _load_bcrypt)
+    _timed(report, 'rsa_keys', _load_rsa_keys)
+    _timed(report, 'denylist', _load_denylist)
+    _timed(report, 'tables', _warm_tables)
+    _timed(report, 'token', _warm_token)
+    report['total'] = round((time.perf_counter() - start) * 1000, 2)
+    app.state.startup_report = report
+    logger.info('startup warmed in %sms %s', report['total'], report)
+
+    yield
+
+    if os.getenv('TOKEN_DENYLIST_PATH') and JsonToken.denylist is not None:
+        JsonToken.denylist.save(os.getenv('TOKEN_DENYLIST_PATH'))
+    RSAUtility.shutdown_pool()
+
+
+def _response_class():
+    if os.getenv('FAST_JSON', '0') != '1':
+        return JSONResponse
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        logger.warning('FAST_JSON=1 이지만 orjson이 설치되어 있지 않아 JSONResponse를 사용합니다.')
+        return JSONResponse
+    return ORJSONResponse
+
+
+def create_app() -> FastAPI:
+    """
+        FastAPI 앱 생성
+    """
+    app = FastAPI(lifespan=lifespan, default_response_class=_response_class())
+
+    if os.getenv('METRICS', '0') == '1':
+        registry = MetricsRegistry()
+        instrument(registry)
+        app.add_middleware(MetricsMiddleware, registry=registry)
+
+        @app.get('/metrics', include_in_schema=False)
+        def metrics():
+            return PlainTextResponse(registry.render(), media_type='text/plain; version=0.0.4')
+
+    @app.get('/')
+    def main():
+        return {'tt': 'aas'}
+
+    return app
+
+
+app = create_app()
 
-app = FastAPI()
 
-@app.get('/')
-def main():
-    return {'tt': 'aas'}
+if __name__ == '__main__':
+    _calibrate_bcrypt()
+    uvicorn.run(
+        'main:create_app',
+        factory=True,
+        host=os.getenv('WEB_HOST', '0.0.0.0'),
+        port=int(os.getenv('WEB_PORT', 8000)),
+        workers=int(os.getenv('WEB_WORKERS', os.cpu_count() or 1)),
+    )
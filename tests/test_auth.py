@@ -0,0 +1,93 @@
+"""
+common/auth.py 하이브리드 암호화 테스트
+
+    python -m pytest tests/test_auth.py
+"""
+import os
+
+from Crypto.PublicKey import RSA
+import pytest
+
+from common.auth import RSAUtility
+
+CHUNK = 16
+
+
+@pytest.fixture(scope='module')
+def rsa(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('keys')
+    key = RSA.generate(2048)
+    private_path, public_path = str(tmp / 'private.pem'), str(tmp / 'public.pem')
+    with open(private_path, 'wb') as f:
+        f.write(key.export_key('PEM'))
+    with open(public_path, 'wb') as f:
+        f.write(key.public_key().export_key('PEM'))
+    return RSAUtility(private_path, public_path)
+
+
+def _decode(rsa, parts) -> bytes:
+    return b''.join(rsa.decode_stream(parts))
+
+
+@pytest.mark.parametrize('size', [0, 1, CHUNK - 1, CHUNK, CHUNK + 1, CHUNK * 3, CHUNK * 3 + 5, 1000])
+def test_round_trip(rsa, size):
+    data = os.urandom(size)
+    assert _decode(rsa, rsa.encode_stream([data], CHUNK)) == data
+
+
+def test_empty_input_has_one_final_frame(rsa):
+    header, *frames = rsa.encode_stream([], CHUNK)
+    assert len(frames) == 1
+    assert len(frames[0]) == 4 + 16
+    assert _decode(rsa, [header] + frames) == b''
+    assert rsa.decode_bytes(rsa.encode_bytes(b'')) == b''
+
+
+def test_exact_multiple_of_frame_size(rsa):
+    data = os.urandom(CHUNK * 4)
+    header, *frames = rsa.encode_stream([data[i:i + 5] for i in range(0, len(data), 5)], CHUNK)
+    assert len(frames) == 4
+    assert _decode(rsa, [header] + frames) == data
+
+
+def test_rechunked_ciphertext(rsa):
+    data = os.urandom(CHUNK * 10 + 7)
+    en_data = b''.join(rsa.encode_stream([data], CHUNK))
+    assert _decode(rsa, [en_data[i:i + 1] for i in range(len(en_data))]) == data
+    assert _decode(rsa, [en_data[i:i + 37] for i in range(0, len(en_data), 37)]) == data
+    assert rsa.decode_bytes(en_data) == data
+
+
+def _frames(rsa, data: bytes) -> list:
+    return list(rsa.encode_stream([data], CHUNK))
+
+
+@pytest.mark.parametrize('tamper', [
+    pytest.param(lambda parts: [parts[0], parts[2], parts[1]] + parts[3:], id='reorder'),
+    pytest.param(lambda parts: parts[:-1], id='drop-final-frame'),
+    pytest.param(lambda parts: parts + [parts[-1]], id='extend'),
+    pytest.param(lambda parts: parts[:2] + parts[3:], id='drop-middle-frame'),
+    pytest.param(lambda parts: parts[:-1] + [parts[-1][:-1]], id='truncate-bytes'),
+    pytest.param(lambda parts: parts[:1] + [parts[1][:-1] + bytes([parts[1][-1] ^ 1])] + parts[2:], id='flip-tag'),
+    pytest.param(lambda parts: parts[:1] + [parts[1][:5] + bytes([parts[1][5] ^ 1]) + parts[1][6:]] + parts[2:], id='flip-data'),
+    pytest.param(lambda parts: [parts[0][:-1] + bytes([parts[0][-1] ^ 1])] + parts[1:], id='flip-wrapped-key'),
+    pytest.param(lambda parts: [b'XXXX' + parts[0][4:]] + parts[1:], id='bad-magic'),
+    pytest.param(lambda parts: [parts[0][:10]], id='truncate-header'),
+])
+def test_rejects_modified_stream(rsa, tamper):
+    parts = _frames(rsa, os.urandom(CHUNK * 3 + 3))
+    with pytest.raises(ValueError):
+        _decode(rsa, tamper(parts))
+
+
+def test_rejects_frame_from_other_message(rsa):
+    data = os.urandom(CHUNK * 2)
+    first, second = _frames(rsa, data), _frames(rsa, data)
+    with pytest.raises(ValueError):
+        _decode(rsa, first[:2] + second[2:])
+
+
+def test_rejects_oversized_frame(rsa):
+    header = _frames(rsa, os.urandom(CHUNK))[0]
+    with pytest.raises(ValueError):
+        _decode(rsa, [header, (RSAUtility.stream_max_frame + 1).to_bytes(4, 'big')])
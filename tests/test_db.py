@@ -0,0 +1,144 @@
+"""
+common/db.py 테스트
+
+    DB_DSN='host=localhost dbname=test user=test password=...' python -m pytest tests/test_db.py
+
+DB_DSN이 설정되지 않은 경우 PostgreSQL이 필요한 테스트는 건너뜁니다.
+테스트마다 임시 테이블을 만들고 종료 시 삭제합니다.
+"""
+import os
+import uuid
+
+import pandas as pd
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from common.db import Database, PoolTimeoutError, _CsvStream, _frame_rows, get_connection
+
+
+def test_frame_rows_keeps_integers_with_missing_values():
+    df = pd.DataFrame({
+        'user_no': [1, None, 3],
+        'score': [1.5, None, 2.0],
+        'name': ['a', None, ''],
+    })
+    rows = list(_frame_rows(df, ['user_no', 'score', 'name'], chunk_rows=2))
+    assert rows == [(1, 1.5, 'a'), (None, None, None), (3, 2.0, '')]
+    assert _CsvStream(rows).read() == '"1","1.5","a"\n,,\n"3","2.0",""\n'
+
+
+def test_csv_stream_partial_reads():
+    rows = [(n, f'row "{n}"') for n in range(100)]
+    stream = _CsvStream(rows)
+    parts = []
+    while True:
+        part = stream.read(7)
+        if not part:
+            break
+        parts.append(part)
+    assert ''.join(parts) == _CsvStream(rows).read()
+
+
+requires_db = pytest.mark.skipif(not os.getenv('DB_DSN'), reason='DB_DSN이 설정되지 않았습니다.')
+
+
+@pytest.fixture
+def database():
+    database = Database(minconn=1, maxconn=2, timeout=1)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def table(database):
+    name = f'test_db_{uuid.uuid4().hex[:8]}'
+    with database.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f'CREATE TABLE {name} (user_no integer, score double precision, name text)')
+    yield name
+    with database.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f'DROP TABLE IF EXISTS {name}')
+
+
+def _select(database, table: str) -> list:
+    with database.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f'SELECT user_no, score, name FROM {table} ORDER BY user_no NULLS LAST, name')
+            return cur.fetchall()
+
+
+@requires_db
+def test_execute_values(database, table):
+    rows = [(n, n / 2, f'user{n}') for n in range(2500)]
+    count = database.execute_values(f'INSERT INTO {table} (user_no, score, name) VALUES %s', rows, page_size=100)
+    assert count == 2500
+    assert _select(database, table)[:2] == [(0, 0.0, 'user0'), (1, 0.5, 'user1')]
+
+
+@requires_db
+def test_copy_rows_null_and_empty(database, table):
+    count = database.copy_rows(table, ['user_no', 'score', 'name'], iter([(1, 1.5, 'a,"b"'), (2, None, ''), (3, 2.0, None)]))
+    assert count == 3
+    assert _select(database, table) == [(1, 1.5, 'a,"b"'), (2, None, ''), (3, 2.0, None)]
+
+
+@requires_db
+def test_copy_frame_integer_column_with_missing_values(database, table):
+    df = pd.DataFrame({'user_no': [1, None, 3], 'score': [1.5, None, 2.0], 'name': ['a', 'b', None]})
+    assert df['user_no'].dtype.kind == 'f'
+    assert database.copy_frame(table, df, chunk_rows=2) == 3
+    assert _select(database, table) == [(1, 1.5, 'a'), (3, 2.0, None), (None, None, 'b')]
+
+
+@requires_db
+def test_stream(database, table):
+    database.execute_values(f'INSERT INTO {table} (user_no) VALUES %s', [(n,) for n in range(5000)])
+    total = 0
+    for row in database.stream(f'SELECT user_no FROM {table}', itersize=500):
+        total += row[0]
+    assert total == sum(range(5000))
+
+
+@requires_db
+def test_rollback_on_error(database, table):
+    with pytest.raises(RuntimeError):
+        with database.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f'INSERT INTO {table} (user_no) VALUES (1)')
+            raise RuntimeError()
+    assert _select(database, table) == []
+
+
+@requires_db
+def test_pool_timeout(database):
+    first = database.getconn()
+    second = database.getconn()
+    try:
+        with pytest.raises(PoolTimeoutError):
+            database.getconn()
+    finally:
+        database.putconn(first)
+        database.putconn(second)
+
+
+@requires_db
+def test_get_connection_commits_only_in_route(database, table):
+    app = FastAPI()
+
+    @app.post('/commit')
+    def commit(conn=Depends(get_connection)):
+        with conn.cursor() as cur:
+            cur.execute(f'INSERT INTO {table} (user_no) VALUES (1)')
+        conn.commit()
+
+    @app.post('/no-commit')
+    def no_commit(conn=Depends(get_connection)):
+        with conn.cursor() as cur:
+            cur.execute(f'INSERT INTO {table} (user_no) VALUES (2)')
+
+    with TestClient(app) as client:
+        assert client.post('/commit').status_code == 200
+        assert client.post('/no-commit').status_code == 200
+    assert _select(database, table) == [(1, None, None)]
@@ -0,0 +1,50 @@
+"""
+Eng2Kor 변환 속성 테스트
+
+    python -m pytest tests/test_eng2kor.py
+"""
+from hypothesis import given, settings, strategies as st
+
+from benchmark.bench_eng2kor import legacy_conv_en2ko, legacy_conv_ko2en
+from common.utiltiy import Eng2Kor, Eng2KorComposer
+
+# 완성형 한글 음절과 공백, 숫자로 이루어진 문자열
+syllables = st.text(alphabet=st.sampled_from([chr(c) for c in range(44032, 55204)] + list(' 0123456789')))
+
+# 자판 입력 문자열 (Shift 조합 포함), 공백, 숫자, 기호
+keys = st.text(alphabet=st.sampled_from(list('abcdefghijklmnopqrstuvwxyzQWERTOP') + list(' 0123456789.,')))
+
+
+@settings(max_examples=500)
+@given(syllables)
+def test_round_trip(string):
+    assert Eng2Kor.conv_en2ko(Eng2Kor.conv_ko2en(string)) == string
+
+
+@settings(max_examples=500)
+@given(syllables)
+def test_conv_ko2en_matches_legacy(string):
+    assert Eng2Kor.conv_ko2en(string) == legacy_conv_ko2en(string)
+
+
+@settings(max_examples=500)
+@given(keys)
+def test_conv_en2ko_matches_legacy(string):
+    assert Eng2Kor.conv_en2ko(string) == legacy_conv_en2ko(string)
+
+
+@settings(max_examples=500)
+@given(st.lists(st.one_of(keys.filter(lambda key: len(key) == 1), st.just(Eng2KorComposer.BACKSPACE))))
+def test_composer_deltas_match_conv_en2ko(strokes):
+    composer = Eng2KorComposer()
+    typed = []
+    committed = ''
+    for key in strokes:
+        if key == Eng2KorComposer.BACKSPACE:
+            typed = typed[:-1]
+        else:
+            typed.append(key)
+        delta = composer.feed(key)
+        committed = committed[:len(committed) - delta.retract] + delta.committed
+        assert committed + delta.pending == Eng2Kor.conv_en2ko(''.join(typed))
+    assert composer.text == Eng2Kor.conv_en2ko(''.join(typed))